@@ -14,9 +14,13 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import os
+import sys
 from decimal import Decimal
 
-import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pcsv
 
 from nautilus_trader.backtest.data.providers import TestDataProvider
 from nautilus_trader.backtest.data.providers import TestInstrumentProvider
@@ -29,11 +33,44 @@ from nautilus_trader.examples.strategies.ema_cross import EMACrossConfig
 from nautilus_trader.model.currencies import ETH
 from nautilus_trader.model.currencies import USDT
 from nautilus_trader.model.enums import AccountType
+from nautilus_trader.model.enums import AggressorSide
 from nautilus_trader.model.enums import OMSType
-from nautilus_trader.model.identifiers import InstrumentId
-from nautilus_trader.model.identifiers import Symbol
 from nautilus_trader.model.identifiers import Venue
 from nautilus_trader.model.objects import Money
+from nautilus_trader.persistence.catalog import DataCatalog
+from nautilus_trader.persistence.external.core import write_objects
+
+
+EXAMPLE_DIR = os.path.dirname(os.path.abspath(__file__))
+CATALOG_PATH = os.path.join(EXAMPLE_DIR, "catalog")
+REPORTS_PATH = os.path.join(EXAMPLE_DIR, "reports")
+
+# Explicit column types for the Binance trades CSV (skips dtype inference)
+TRADES_CSV_COLUMN_TYPES = {
+    "timestamp": pa.timestamp("ns", tz="UTC"),
+    "trade_id": pa.string(),
+    "price": pa.float64(),
+    "quantity": pa.float64(),
+    "buyer_maker": pa.bool_(),
+}
+
+# Immutable venue and instrument definitions, built once at import
+BINANCE = Venue("BINANCE")
+ETHUSDT_BINANCE = TestInstrumentProvider.ethusdt_binance()
+
+# The (fast, slow) EMA periods to run over the same loaded data
+EMA_PERIODS = [(10, 20), (20, 40)]
+
+
+def make_fill_model() -> FillModel:
+    # The random seed is applied on construction, so a fresh model is built
+    # per run rather than shared (a reused model would continue the sequence)
+    return FillModel(
+        prob_fill_on_limit=0.2,
+        prob_fill_on_stop=0.95,
+        prob_slippage=0.5,
+        random_seed=42,
+    )
 
 
 if __name__ == "__main__":
@@ -45,25 +82,41 @@ if __name__ == "__main__":
     # Build the backtest engine
     engine = BacktestEngine(config=config)
 
-    BINANCE = Venue("BINANCE")
-    instrument_id = InstrumentId(symbol=Symbol("ETHUSDT"), venue=BINANCE)
-    ETHUSDT_BINANCE = TestInstrumentProvider.ethusdt_binance()
-
-    # Setup data
-    provider = TestDataProvider()
-    wrangler = TradeTickDataWrangler(instrument=ETHUSDT_BINANCE)
-    ticks = wrangler.process(provider.read_csv_ticks("binance-ethusdt-trades.csv"))
+    # Setup data (the CSV ticks are only parsed when the catalog holds no ticks for
+    # the instrument, and are then written to it for subsequent runs to load directly)
+    os.makedirs(CATALOG_PATH, exist_ok=True)
+    os.makedirs(REPORTS_PATH, exist_ok=True)
+    catalog = DataCatalog(CATALOG_PATH)
+    ticks = catalog.trade_ticks(
+        instrument_ids=[ETHUSDT_BINANCE.id.value],
+        as_nautilus=True,
+        raise_on_empty=False,
+    )
+    if not ticks:
+        provider = TestDataProvider()
+        table = pcsv.read_csv(
+            pa.BufferReader(provider.read("binance-ethusdt-trades.csv")),
+            convert_options=pcsv.ConvertOptions(column_types=TRADES_CSV_COLUMN_TYPES),
+        )
+        wrangler = TradeTickDataWrangler(instrument=ETHUSDT_BINANCE)
+        write_objects(
+            catalog=catalog,
+            chunk=wrangler.process_arrays(
+                prices=table.column("price").to_numpy(),
+                quantities=table.column("quantity").to_numpy(),
+                aggressor_sides=np.where(
+                    table.column("buyer_maker").to_numpy(),
+                    AggressorSide.SELL,
+                    AggressorSide.BUY,
+                ),
+                trade_ids=table.column("trade_id").to_numpy(),
+                ts_events=table.column("timestamp").cast(pa.int64()).to_numpy(),
+            ),
+        )
+        ticks = catalog.trade_ticks(instrument_ids=[ETHUSDT_BINANCE.id.value], as_nautilus=True)
     engine.add_instrument(ETHUSDT_BINANCE)
     engine.add_data(ticks)
 
-    # Create a fill model (optional)
-    fill_model = FillModel(
-        prob_fill_on_limit=0.2,
-        prob_fill_on_stop=0.95,
-        prob_slippage=0.5,
-        random_seed=42,
-    )
-
     # Add an exchange (multiple exchanges possible)
     # Add starting balances for single-currency or multi-currency accounts
     engine.add_venue(
@@ -72,42 +125,53 @@ if __name__ == "__main__":
         account_type=AccountType.CASH,  # Spot cash account
         base_currency=None,  # Multi-currency account
         starting_balances=[Money(1_000_000, USDT), Money(10, ETH)],
-        fill_model=fill_model,
+        fill_model=make_fill_model(),
     )
 
-    # Configure your strategy
-    config = EMACrossConfig(
+    # Only pause when run from a terminal (so non-interactive runs don't stall)
+    if sys.stdin.isatty():
+        input("Press Enter to continue...")  # noqa (always Python 3)
+
+    # Configure your strategy (validated once, then copied per parameter set)
+    base_config = EMACrossConfig(
         instrument_id=str(ETHUSDT_BINANCE.id),
         bar_type="ETHUSDT.BINANCE-250-TICK-LAST-INTERNAL",
         trade_size=Decimal("0.05"),
-        fast_ema=10,
-        slow_ema=20,
         order_id_tag="001",
     )
-    # Instantiate and add your strategy
-    strategy = EMACross(config=config)
-    engine.add_strategy(strategy=strategy)
-
-    input("Press Enter to continue...")  # noqa (always Python 3)
-
-    # Run the engine (from start to end of data)
-    engine.run()
-
-    # Optionally view reports
-    with pd.option_context(
-        "display.max_rows",
-        100,
-        "display.max_columns",
-        None,
-        "display.width",
-        300,
-    ):
-        print(engine.trader.generate_account_report(BINANCE))
-        print(engine.trader.generate_order_fills_report())
-        print(engine.trader.generate_positions_report())
-
-    # For repeated backtest runs make sure to reset the engine
-    engine.reset()
+
+    # Sweep the EMA periods over the same loaded data. The ticks, instruments
+    # and venues added above are retained by `engine.reset()`, so the data is
+    # only loaded once for all runs; only the strategy is swapped between runs.
+    for fast_ema_period, slow_ema_period in EMA_PERIODS:
+        # Reseed the fill model so every run sees the same fill sequence
+        engine.change_fill_model(BINANCE, make_fill_model())
+
+        config = base_config.copy(
+            update={"fast_ema_period": fast_ema_period, "slow_ema_period": slow_ema_period},
+        )
+        # Instantiate and add your strategy
+        strategy = EMACross(config=config)
+        engine.add_strategy(strategy=strategy)
+
+        # Run the engine (from start to end of data)
+        engine.run()
+
+        # Optionally write reports (one set of files per parameter set)
+        run_id = f"ema_{fast_ema_period}_{slow_ema_period}"
+        reports = {
+            "account": engine.trader.generate_account_report(BINANCE),
+            "order_fills": engine.trader.generate_order_fills_report(),
+            "positions": engine.trader.generate_positions_report(),
+        }
+        for name, report in reports.items():
+            report.to_csv(os.path.join(REPORTS_PATH, f"{name}_{run_id}.csv"))
+        print(f"Wrote reports for {run_id} to {REPORTS_PATH}")
+
+        # For repeated backtest runs make sure to reset the engine, then
+        # clear the strategy so the next parameter set can be added
+        engine.reset()
+        engine.trader.clear_strategies()
 
     # Good practice to dispose of the object
     engine.dispose()
@@ -15,12 +15,18 @@
 # -------------------------------------------------------------------------------------------------
 
 import asyncio
+import json
+import os
+import tempfile
+import time
 import traceback
+from typing import List, Optional
 
 from nautilus_trader.adapters.betfair.factories import BetfairLiveDataClientFactory
 from nautilus_trader.adapters.betfair.factories import BetfairLiveExecClientFactory
 from nautilus_trader.adapters.betfair.factories import get_cached_betfair_client
 from nautilus_trader.adapters.betfair.factories import get_cached_betfair_instrument_provider
+from nautilus_trader.adapters.betfair.providers import BetfairInstrumentProvider
 from nautilus_trader.common.clock import LiveClock
 from nautilus_trader.common.logging import LiveLogger
 from nautilus_trader.config import CacheDatabaseConfig
@@ -28,11 +34,48 @@ from nautilus_trader.config import TradingNodeConfig
 from nautilus_trader.examples.strategies.orderbook_imbalance import OrderBookImbalance
 from nautilus_trader.examples.strategies.orderbook_imbalance import OrderBookImbalanceConfig
 from nautilus_trader.live.node import TradingNode
+from nautilus_trader.model.instruments.betting import BettingInstrument
 
 
 # *** THIS IS A TEST STRATEGY WITH NO ALPHA ADVANTAGE WHATSOEVER. ***
 # *** IT IS NOT INTENDED TO BE USED TO TRADE LIVE WITH REAL MONEY. ***
 
+INSTRUMENTS_CACHE_TTL_SECS = 3600  # Reload instruments from Betfair after 1 hour
+
+
+def load_cached_instruments(path: str) -> Optional[List[BettingInstrument]]:
+    if not os.path.exists(path):
+        return None
+    if time.time() - os.path.getmtime(path) > INSTRUMENTS_CACHE_TTL_SECS:
+        return None
+    with open(path) as f:
+        return [
+            BettingInstrument.from_dict({k: v for k, v in values.items() if k != "type"})
+            for values in json.load(f)
+        ]
+
+
+def write_cached_instruments(path: str, instruments: List[BettingInstrument]) -> None:
+    with open(path, "w") as f:
+        json.dump([BettingInstrument.to_dict(instrument) for instrument in instruments], f)
+
+
+async def load_instruments(
+    provider: BetfairInstrumentProvider,
+    cache_path: str,
+) -> List[BettingInstrument]:
+    instruments = load_cached_instruments(cache_path)
+    if instruments is None:
+        await provider.load_all_async()
+        instruments = provider.list_all()
+        write_cached_instruments(cache_path, instruments)
+    else:
+        # The node's data and execution clients are given this same cached provider
+        # (keyed on the client and market filter), and only reload from Betfair when
+        # it is empty
+        provider.add_bulk(instruments)
+    return instruments
+
 
 async def main(market_id: str):
     # Connect to Betfair client early to load instruments and account currency
@@ -48,20 +91,22 @@ async def main(market_id: str):
     )
     await client.connect()
 
-    # Find instruments for a particular market_id
+    # Find instruments for a particular market_id (reusing a recent local
+    # snapshot where available rather than re-fetching from Betfair), while
+    # concurrently determining the account currency
     market_filter = {"market_id": (market_id,)}
     provider = get_cached_betfair_instrument_provider(
         client=client,
         logger=logger,
         market_filter=tuple(market_filter.items()),
     )
-    await provider.load_all_async()
-    instruments = provider.list_all()
+    cache_path = os.path.join(tempfile.gettempdir(), f"betfair_instruments_{market_id}.json")
+    instruments, account = await asyncio.gather(
+        load_instruments(provider, cache_path),
+        client.get_account_details(),
+    )
     print(f"Found instruments:\n{instruments}")
 
-    # Determine account currency
-    account = await client.get_account_details()
-
     # Configure trading node
     config = TradingNodeConfig(
         timeout_connection=30.0,
@@ -52,7 +52,9 @@ config_node = TradingNodeConfig(
             base_url_ws=None,  # Override with custom endpoint
             us=False,  # If client is for Binance US
             testnet=False,  # If client uses the testnet
-            instrument_provider=InstrumentProviderConfig(load_all=True),
+            instrument_provider=InstrumentProviderConfig(
+                load_ids=frozenset({"ETHUSDT.BINANCE"}),  # Only load the traded instrument
+            ),
         ),
     },
     exec_clients={
@@ -64,9 +66,9 @@ config_node = TradingNodeConfig(
             base_url_ws=None,  # Override with custom endpoint
             us=False,  # If client is for Binance US
             testnet=False,  # If client uses the testnet
-            load_all_instruments=True,  # If load all instruments on start
-            load_instrument_ids=[],  # Optionally pass a list of instrument IDs
-            instrument_provider=InstrumentProviderConfig(load_all=True),
+            instrument_provider=InstrumentProviderConfig(
+                load_ids=frozenset({"ETHUSDT.BINANCE"}),  # Only load the traded instrument
+            ),
         ),
     },
     timeout_connection=5.0,
@@ -34,6 +34,7 @@ from nautilus_trader.msgbus.bus import MessageBus
 
 
 CLIENTS: Dict[str, BetfairClient] = {}
+INSTRUMENT_PROVIDERS: Dict[tuple, BetfairInstrumentProvider] = {}
 
 
 @lru_cache(1)
@@ -108,7 +109,8 @@ def get_cached_betfair_instrument_provider(
     """
     Cache and return a BetfairInstrumentProvider.
 
-    If a cached provider already exists, then that cached provider will be returned.
+    If a cached provider for the given client and market filter already exists,
+    then that cached provider will be returned.
 
     Parameters
     ----------
@@ -124,10 +126,20 @@ def get_cached_betfair_instrument_provider(
     BinanceInstrumentProvider
 
     """
-    LoggerAdapter("BetfairFactory", logger).warning(
-        "Creating new instance of BetfairInstrumentProvider"
-    )
-    return BetfairInstrumentProvider(client=client, logger=logger, filters=dict(market_filter))
+    global INSTRUMENT_PROVIDERS
+
+    key: tuple = (client, market_filter)
+    if key not in INSTRUMENT_PROVIDERS:
+        LoggerAdapter("BetfairFactory", logger).warning(
+            "Creating new instance of BetfairInstrumentProvider"
+        )
+        provider = BetfairInstrumentProvider(
+            client=client,
+            logger=logger,
+            filters=dict(market_filter),
+        )
+        INSTRUMENT_PROVIDERS[key] = provider
+    return INSTRUMENT_PROVIDERS[key]
 
 
 class BetfairLiveDataClientFactory(LiveDataClientFactory):
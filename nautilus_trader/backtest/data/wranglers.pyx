@@ -18,6 +18,7 @@ from copy import copy
 import numpy as np
 
 from libc.stdint cimport int64_t
+from libc.stdint cimport uint8_t
 from libc.stdint cimport uint64_t
 
 import random
@@ -342,6 +343,79 @@ cdef class TradeTickDataWrangler:
                 ts_inits,
             ))
 
+    def process_arrays(
+        self,
+        prices: np.ndarray,
+        quantities: np.ndarray,
+        aggressor_sides: np.ndarray,
+        trade_ids: np.ndarray,
+        ts_events: np.ndarray,
+        ts_init_delta: int=0,
+    ):
+        """
+        Process the given column arrays into Nautilus `TradeTick` objects.
+
+        This avoids the per-row overhead of iterating a `pd.DataFrame` by building
+        the ticks in a single typed loop over the pre-extracted columns.
+
+        Parameters
+        ----------
+        prices : np.ndarray
+            The trade prices (will be cast to `float64`).
+        quantities : np.ndarray
+            The trade sizes (will be cast to `float64`).
+        aggressor_sides : np.ndarray
+            The `AggressorSide` values for each trade (will be cast to `uint8`).
+        trade_ids : np.ndarray
+            The trade match IDs.
+        ts_events : np.ndarray
+            The UNIX timestamps (nanoseconds) when the trades occurred (will be cast to `int64`).
+        ts_init_delta : int
+            The difference in nanoseconds between the data timestamps and the
+            `ts_init` value. Can be used to represent/simulate latency between
+            the data source and the Nautilus system.
+
+        Returns
+        -------
+        list[TradeTick]
+
+        Raises
+        ------
+        ValueError
+            If `prices` is empty.
+        ValueError
+            If the lengths of the given arrays are not equal.
+
+        """
+        cdef int count = len(prices)
+        Condition.positive_int(count, "len(prices)")
+        Condition.equal(len(quantities), count, "len(quantities)", "len(prices)")
+        Condition.equal(len(aggressor_sides), count, "len(aggressor_sides)", "len(prices)")
+        Condition.equal(len(trade_ids), count, "len(trade_ids)", "len(prices)")
+        Condition.equal(len(ts_events), count, "len(ts_events)", "len(prices)")
+
+        cdef double[:] prices_view = np.ascontiguousarray(prices, dtype=np.float64)
+        cdef double[:] quantities_view = np.ascontiguousarray(quantities, dtype=np.float64)
+        cdef uint8_t[:] sides_view = np.ascontiguousarray(aggressor_sides, dtype=np.uint8)
+        cdef int64_t[:] ts_events_view = np.ascontiguousarray(ts_events, dtype=np.int64)
+
+        cdef list ticks = [None] * count
+        cdef int i
+        for i in range(count):
+            ticks[i] = TradeTick.from_raw_c(
+                self.instrument.id,
+                <int64_t>(prices_view[i] * 1e9),
+                self.instrument.price_precision,
+                <uint64_t>(quantities_view[i] * 1e9),
+                self.instrument.size_precision,
+                <AggressorSide>sides_view[i],
+                TradeId(str(trade_ids[i])),
+                ts_events_view[i],
+                ts_events_view[i] + ts_init_delta,
+            )
+
+        return ticks
+
     def _create_side_if_not_exist(self, data):
         if "side" in data.columns:
             return data["side"].apply(lambda x: AggressorSide.BUY if str(x).upper() == "BUY" else AggressorSide.SELL)
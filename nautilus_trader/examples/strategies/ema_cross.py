@@ -29,6 +29,7 @@ from nautilus_trader.model.data.ticker import Ticker
 from nautilus_trader.model.enums import OrderSide
 from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.model.instruments.base import Instrument
+from nautilus_trader.model.objects import Quantity
 from nautilus_trader.model.orderbook.book import OrderBook
 from nautilus_trader.model.orderbook.data import OrderBookData
 from nautilus_trader.model.orders.market import MarketOrder
@@ -96,6 +97,7 @@ class EMACross(Strategy):
         self.slow_ema = ExponentialMovingAverage(config.slow_ema_period)
 
         self.instrument: Optional[Instrument] = None  # Initialized in on_start
+        self.trade_quantity: Optional[Quantity] = None  # Initialized in on_start
 
     def on_start(self):
         """Actions to be performed on strategy start."""
@@ -105,6 +107,8 @@ class EMACross(Strategy):
             self.stop()
             return
 
+        self.trade_quantity = self.instrument.make_qty(self.trade_size)
+
         # Register the indicators for updating
         self.register_indicator_for_bars(self.bar_type, self.fast_ema)
         self.register_indicator_for_bars(self.bar_type, self.slow_ema)
@@ -249,7 +253,7 @@ class EMACross(Strategy):
         order: MarketOrder = self.order_factory.market(
             instrument_id=self.instrument_id,
             order_side=OrderSide.BUY,
-            quantity=self.instrument.make_qty(self.trade_size),
+            quantity=self.trade_quantity,
             # time_in_force=TimeInForce.FOK,
         )
 
@@ -262,7 +266,7 @@ class EMACross(Strategy):
         order: MarketOrder = self.order_factory.market(
             instrument_id=self.instrument_id,
             order_side=OrderSide.SELL,
-            quantity=self.instrument.make_qty(self.trade_size),
+            quantity=self.trade_quantity,
             # time_in_force=TimeInForce.FOK,
         )
 
@@ -31,6 +31,7 @@ from nautilus_trader.model.enums import TimeInForce
 from nautilus_trader.model.events.order import OrderFilled
 from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.model.instruments.base import Instrument
+from nautilus_trader.model.objects import Quantity
 from nautilus_trader.model.orderbook.book import OrderBook
 from nautilus_trader.model.orderbook.data import OrderBookDelta
 from nautilus_trader.model.orders.limit import LimitOrder
@@ -96,6 +97,7 @@ class VolatilityMarketMaker(Strategy):
         self.atr = AverageTrueRange(config.atr_period)
 
         self.instrument: Optional[Instrument] = None  # Initialized in on_start
+        self.trade_quantity: Optional[Quantity] = None  # Initialized in on_start
 
         # Users order management variables
         self.buy_order: Union[LimitOrder, None] = None
@@ -109,6 +111,8 @@ class VolatilityMarketMaker(Strategy):
             self.stop()
             return
 
+        self.trade_quantity = self.instrument.make_qty(self.trade_size)
+
         # Register the indicators for updating
         self.register_indicator_for_bars(self.bar_type, self.atr)
 
@@ -272,7 +276,7 @@ class VolatilityMarketMaker(Strategy):
         order: LimitOrder = self.order_factory.limit(
             instrument_id=self.instrument_id,
             order_side=OrderSide.BUY,
-            quantity=self.instrument.make_qty(self.trade_size),
+            quantity=self.trade_quantity,
             price=self.instrument.make_price(price),
             time_in_force=TimeInForce.GTC,
             post_only=True,  # default value is True
@@ -290,7 +294,7 @@ class VolatilityMarketMaker(Strategy):
         order: LimitOrder = self.order_factory.limit(
             instrument_id=self.instrument_id,
             order_side=OrderSide.SELL,
-            quantity=self.instrument.make_qty(self.trade_size),
+            quantity=self.trade_quantity,
             price=self.instrument.make_price(price),
             time_in_force=TimeInForce.GTC,
             post_only=True,  # default value is True
@@ -19,3 +19,6 @@ from nautilus_trader.indicators.average.moving_average cimport MovingAverage
 cdef class ExponentialMovingAverage(MovingAverage):
     cdef readonly double alpha
     """The moving average alpha value.\n\n:returns: `double`"""
+    cdef double _alpha_complement
+
+    cpdef void update_raw_array(self, double[:] values) except *
@@ -45,6 +45,7 @@ cdef class ExponentialMovingAverage(MovingAverage):
         super().__init__(period, params=[period], price_type=price_type)
 
         self.alpha = 2.0 / (period + 1.0)
+        self._alpha_complement = 1.0 - self.alpha
         self.value = 0
 
     cpdef void handle_quote_tick(self, QuoteTick tick) except *:
@@ -104,5 +105,30 @@ cdef class ExponentialMovingAverage(MovingAverage):
         if not self.has_inputs:
             self.value = value
 
-        self.value = self.alpha * value + ((1.0 - self.alpha) * self.value)
+        self.value = self.alpha * value + (self._alpha_complement * self.value)
         self._increment_count()
+
+    cpdef void update_raw_array(self, double[:] values) except *:
+        """
+        Update the indicator with the given raw values in sequence.
+
+        Parameters
+        ----------
+        values : np.ndarray[double]
+            The update values (oldest first).
+
+        """
+        if values.shape[0] == 0:
+            return
+
+        # Run the recurrence on a local, then write the result back once
+        cdef double value = self.value
+        if not self.has_inputs:
+            value = values[0]
+
+        cdef int i
+        for i in range(values.shape[0]):
+            value = self.alpha * values[i] + (self._alpha_complement * value)
+            self._increment_count()
+
+        self.value = value
@@ -18,6 +18,11 @@ from nautilus_trader.indicators.base.indicator cimport Indicator
 
 cdef class LinearRegression(Indicator):
     cdef object _inputs
+    cdef double _sum_x
+    cdef double _denominator
+    cdef double _sum_y
+    cdef double _sum_xy
+    cdef int _slides
 
     cdef readonly int period
     """The window period.\n\n:returns: `int`"""
@@ -29,3 +34,5 @@ cdef class LinearRegression(Indicator):
     """The current value.\n\n:returns: `double`"""
 
     cpdef void update_raw(self, double close_price) except *
+    cpdef void update_raw_array(self, double[:] close_prices) except *
+    cdef void _recalculate_sums(self) except *
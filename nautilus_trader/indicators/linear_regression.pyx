@@ -14,10 +14,6 @@
 # -------------------------------------------------------------------------------------------------
 
 from collections import deque
-from statistics import mean
-
-import numpy as np
-cimport numpy as np
 
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.indicators.base.indicator cimport Indicator
@@ -27,6 +23,9 @@ from nautilus_trader.model.data.bar cimport Bar
 cdef class LinearRegression(Indicator):
     """
     An indicator that calculates a simple linear regression.
+
+    The fit is updated incrementally from running sums over the window, with
+    the sums periodically recalculated to prevent floating point drift.
     """
 
     def __init__(self, int period=0):
@@ -49,6 +48,14 @@ cdef class LinearRegression(Indicator):
 
         self.period = period
         self._inputs = deque(maxlen=self.period)
+        # The x positions 0 to period - 1 are fixed, so their sums are constant
+        cdef double n = period
+        cdef double sum_x2 = (n - 1.0) * n * (2.0 * n - 1.0) / 6.0
+        self._sum_x = n * (n - 1.0) / 2.0
+        self._denominator = n * sum_x2 - self._sum_x * self._sum_x
+        self._sum_y = 0.0
+        self._sum_xy = 0.0
+        self._slides = 0
         self.slope = 0.0
         self.intercept = 0.0
         self.value = 0.0
@@ -77,7 +84,20 @@ cdef class LinearRegression(Indicator):
             The close price.
 
         """
-        self._inputs.append(close_price)
+        cdef double oldest
+        if len(self._inputs) == self.period:
+            # Slide the window (each remaining input moves back one x position)
+            oldest = self._inputs[0]
+            self._sum_xy += (self.period - 1) * close_price - (self._sum_y - oldest)
+            self._sum_y += close_price - oldest
+            self._inputs.append(close_price)
+            self._slides += 1
+            if self._slides == self.period:
+                self._recalculate_sums()
+        else:
+            self._sum_xy += len(self._inputs) * close_price
+            self._sum_y += close_price
+            self._inputs.append(close_price)
 
         # Warmup indicator logic
         if not self.initialized:
@@ -87,19 +107,39 @@ cdef class LinearRegression(Indicator):
             else:
                 return
 
-        cdef np.ndarray x_arr = np.arange(self.period)
-        self.slope = ((mean(x_arr) * mean(self._inputs)) - mean(x_arr * self._inputs)) / ((mean(x_arr) * mean(x_arr)) - mean(x_arr * x_arr))
-        self.intercept = mean(self._inputs) - self.slope * mean(x_arr)
+        self.slope = (self.period * self._sum_xy - self._sum_x * self._sum_y) / self._denominator
+        self.intercept = (self._sum_y - self.slope * self._sum_x) / self.period
+        self.value = self.slope * (self.period - 1) + self.intercept
 
-        cdef list regression_line = []
-        cdef double x
-        for x in x_arr:
-            regression_line.append((self.slope * x) + self.intercept)
+    cpdef void update_raw_array(self, double[:] close_prices) except *:
+        """
+        Update the indicator with the given raw values in sequence.
 
-        self.value = regression_line[-1]
+        Parameters
+        ----------
+        close_prices : np.ndarray[double]
+            The close prices (oldest first).
+
+        """
+        cdef int i
+        for i in range(close_prices.shape[0]):
+            self.update_raw(close_prices[i])
+
+    cdef void _recalculate_sums(self) except *:
+        cdef int x
+        cdef double y
+        self._sum_y = 0.0
+        self._sum_xy = 0.0
+        for x, y in enumerate(self._inputs):
+            self._sum_y += y
+            self._sum_xy += x * y
+        self._slides = 0
 
     cpdef void _reset(self) except *:
         self._inputs.clear()
+        self._sum_y = 0.0
+        self._sum_xy = 0.0
+        self._slides = 0
         self.slope = 0.0
         self.intercept = 0.0
         self.value = 0.0
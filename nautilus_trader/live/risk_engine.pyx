@@ -163,8 +163,8 @@ cdef class LiveRiskEngine(RiskEngine):
         """
         Execute the given command.
 
-        If the internal queue is already full then will log a warning and block
-        until queue size reduces.
+        If the internal queue is already full then will log a warning and schedule
+        a background put task, which queues the message once the queue has room.
 
         Parameters
         ----------
@@ -190,8 +190,8 @@ cdef class LiveRiskEngine(RiskEngine):
         """
         Process the given event.
 
-        If the internal queue is already full then will log a warning and block
-        until queue size reduces.
+        If the internal queue is already full then will log a warning and schedule
+        a background put task, which queues the message once the queue has room.
 
         Parameters
         ----------
@@ -211,7 +211,7 @@ cdef class LiveRiskEngine(RiskEngine):
             self._queue.put_nowait(event)
         except asyncio.QueueFull:
             self._log.warning(f"Blocking on `_queue.put` as queue full at {self._queue.qsize()} items.")
-            self._queue.put(event)  # Block until qsize reduces below maxsize
+            self._loop.create_task(self._queue.put(event))  # Queued once the queue has room
 
 # -- INTERNAL -------------------------------------------------------------------------------------
 
@@ -19,6 +19,7 @@ def tests(session: Session) -> None:
         session,
         "--ignore=tests/integration_tests/",
         "--ignore=tests/performance_tests/",
+        parallel="no-parallel" not in session.posargs,
     )
 
 
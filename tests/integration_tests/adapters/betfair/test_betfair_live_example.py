@@ -0,0 +1,143 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import asyncio
+from unittest.mock import AsyncMock
+from unittest.mock import patch
+
+import pytest
+
+from examples.live.betfair import load_instruments
+from examples.live.betfair import write_cached_instruments
+from nautilus_trader.adapters.betfair.client.core import BetfairClient
+from nautilus_trader.adapters.betfair.common import BETFAIR_VENUE
+from nautilus_trader.adapters.betfair.factories import BetfairLiveDataClientFactory
+from nautilus_trader.adapters.betfair.factories import get_cached_betfair_client
+from nautilus_trader.adapters.betfair.factories import get_cached_betfair_instrument_provider
+from nautilus_trader.adapters.betfair.providers import BetfairInstrumentProvider
+from nautilus_trader.common.clock import LiveClock
+from nautilus_trader.common.logging import LiveLogger
+from nautilus_trader.msgbus.bus import MessageBus
+from tests.integration_tests.adapters.betfair.test_kit import BetfairTestStubs
+from tests.test_kit.stubs.component import TestComponentStubs
+from tests.test_kit.stubs.identifiers import TestIdStubs
+
+
+class TestBetfairLiveExampleInstruments:
+    def setup(self):
+        # Fixture Setup
+        self.loop = asyncio.get_event_loop()
+        self.clock = LiveClock()
+        self.logger = LiveLogger(loop=self.loop, clock=self.clock)
+        self.client = BetfairTestStubs.betfair_client(loop=self.loop, logger=self.logger)
+        self.provider = BetfairInstrumentProvider(
+            client=self.client,
+            logger=TestComponentStubs.logger(),
+        )
+        self.instruments = [
+            BetfairTestStubs.betting_instrument(selection_id="50214"),
+            BetfairTestStubs.betting_instrument(selection_id="50215"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_load_instruments_on_warm_start_fills_provider_without_loading(self, tmp_path):
+        # Arrange
+        cache_path = str(tmp_path / "instruments.json")
+        write_cached_instruments(cache_path, self.instruments)
+
+        # Act
+        with patch.object(self.provider, "load_all_async", new_callable=AsyncMock) as load_all:
+            instruments = await load_instruments(self.provider, cache_path)
+
+        # Assert
+        load_all.assert_not_awaited()
+        assert [i.id for i in instruments] == [i.id for i in self.instruments]
+        assert self.provider.count == len(self.instruments)  # Clients will not reload
+
+    @pytest.mark.asyncio
+    async def test_load_instruments_on_cold_start_loads_and_writes_snapshot(self, tmp_path):
+        # Arrange
+        cache_path = str(tmp_path / "instruments.json")
+
+        async def load_all_async():
+            self.provider.add_bulk(self.instruments)
+
+        # Act
+        with patch.object(self.provider, "load_all_async", side_effect=load_all_async) as load_all:
+            instruments = await load_instruments(self.provider, cache_path)
+
+        # Assert
+        load_all.assert_called_once()
+        assert [i.id for i in instruments] == [i.id for i in self.instruments]
+        assert (tmp_path / "instruments.json").exists()
+
+    @pytest.mark.asyncio
+    @patch("nautilus_trader.adapters.betfair.data.BetfairDataClient._post_connect_heartbeat")
+    @patch("nautilus_trader.adapters.betfair.data.BetfairMarketStreamClient.connect")
+    @patch("nautilus_trader.adapters.betfair.client.core.BetfairClient.connect")
+    async def test_factory_data_client_on_warm_start_does_not_reload_instruments(
+        self,
+        mock_client_connect,
+        mock_stream_connect,
+        mock_post_connect_heartbeat,
+        tmp_path,
+    ):
+        # Arrange
+        cache_path = str(tmp_path / "instruments.json")
+        write_cached_instruments(cache_path, self.instruments)
+        market_filter = {"market_id": ("1.180759290",)}
+        credentials = {
+            "username": "EXAMPLE_BETFAIR_USERNAME",
+            "password": "EXAMPLE_BETFAIR_PASSWORD",
+            "app_key": "EXAMPLE_BETFAIR_APP_KEY",
+            "cert_dir": "EXAMPLE_BETFAIR_CERT_DIR",
+        }
+
+        # The example loads instruments with its own logger, whereas the node
+        # factories are passed the kernel logger
+        kernel_logger = LiveLogger(loop=self.loop, clock=self.clock)
+        msgbus = MessageBus(
+            trader_id=TestIdStubs.trader_id(),
+            clock=self.clock,
+            logger=kernel_logger,
+        )
+
+        with patch.object(BetfairClient, "ssl_context", return_value=True):
+            client = get_cached_betfair_client(loop=self.loop, logger=self.logger, **credentials)
+            provider = get_cached_betfair_instrument_provider(
+                client=client,
+                logger=self.logger,
+                market_filter=tuple(market_filter.items()),
+            )
+            await load_instruments(provider, cache_path)
+
+            data_client = BetfairLiveDataClientFactory.create(
+                loop=self.loop,
+                name=BETFAIR_VENUE.value,
+                config={**credentials, "market_filter": market_filter},
+                msgbus=msgbus,
+                cache=TestComponentStubs.cache(),
+                clock=self.clock,
+                logger=kernel_logger,
+            )
+
+        # Act
+        with patch.object(provider, "load_all_async", new_callable=AsyncMock) as load_all:
+            await data_client._connect()
+
+        # Assert
+        load_all.assert_not_awaited()
+        assert data_client._instrument_provider is provider
+        assert data_client._instrument_provider.count == len(self.instruments)
@@ -0,0 +1,43 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+
+import asyncio
+from typing import Callable
+
+
+async def eventually(condition: Callable[[], bool], timeout: float = 2.0) -> None:
+    """
+    Yield to the event loop until the given condition is true.
+
+    Parameters
+    ----------
+    condition : Callable[[], bool]
+        The condition to wait for.
+    timeout : float
+        The maximum time to wait in seconds.
+
+    Raises
+    ------
+    AssertionError
+        If `condition` is not true before `timeout`.
+
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not condition():
+        if loop.time() > deadline:
+            raise AssertionError(f"Condition not met within {timeout}s")
+        await asyncio.sleep(0)
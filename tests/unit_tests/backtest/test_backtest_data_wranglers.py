@@ -15,6 +15,9 @@
 
 import os
 
+import numpy as np
+import pytest
+
 from nautilus_trader.backtest.data.loaders import TardisQuoteDataLoader
 from nautilus_trader.backtest.data.loaders import TardisTradeDataLoader
 from nautilus_trader.backtest.data.providers import TestDataProvider
@@ -201,6 +204,47 @@ class TestTradeTickDataWrangler:
         assert ticks[0].ts_event == 1597399200223000064
         assert ticks[0].ts_init == 1597399200224000564  # <-- delta diff
 
+    def test_process_arrays(self):
+        # Arrange
+        ethusdt = TestInstrumentProvider.ethusdt_binance()
+        wrangler = TradeTickDataWrangler(instrument=ethusdt)
+        provider = TestDataProvider()
+        data = provider.read_csv_ticks("binance-ethusdt-trades.csv")[:100]
+
+        # Act
+        ticks = wrangler.process_arrays(
+            prices=data["price"].to_numpy(),
+            quantities=data["quantity"].to_numpy(),
+            aggressor_sides=np.where(data["buyer_maker"], AggressorSide.SELL, AggressorSide.BUY),
+            trade_ids=data["trade_id"].to_numpy(),
+            ts_events=data.index.asi8,
+            ts_init_delta=1_000_500,
+        )
+
+        # Assert
+        assert len(ticks) == 100
+        assert ticks[0].price == Price.from_str("423.760")
+        assert ticks[0].size == Quantity.from_str("2.67900")
+        assert ticks[0].aggressor_side == AggressorSide.SELL
+        assert ticks[0].trade_id == TradeId("148568980")
+        assert ticks[0].ts_event == 1597399200223000000
+        assert ticks[0].ts_init == 1597399200224000500  # <-- delta diff
+
+    def test_process_arrays_with_mismatched_lengths_raises_value_error(self):
+        # Arrange
+        ethusdt = TestInstrumentProvider.ethusdt_binance()
+        wrangler = TradeTickDataWrangler(instrument=ethusdt)
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            wrangler.process_arrays(
+                prices=np.array([423.76, 423.74]),
+                quantities=np.array([2.679]),
+                aggressor_sides=np.array([AggressorSide.SELL, AggressorSide.BUY]),
+                trade_ids=np.array(["148568980", "148568981"]),
+                ts_events=np.array([0, 1]),
+            )
+
 
 class TestBarDataWrangler:
     def setup(self):
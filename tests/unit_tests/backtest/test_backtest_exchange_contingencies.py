@@ -15,6 +15,8 @@
 
 from decimal import Decimal
 
+import pytest
+
 from nautilus_trader.backtest.data.providers import TestInstrumentProvider
 from nautilus_trader.backtest.exchange import SimulatedExchange
 from nautilus_trader.backtest.execution_client import BacktestExecClient
@@ -23,7 +25,6 @@ from nautilus_trader.backtest.models import LatencyModel
 from nautilus_trader.common.clock import TestClock
 from nautilus_trader.common.logging import Logger
 from nautilus_trader.common.logging import LogLevel
-from nautilus_trader.common.uuid import UUIDFactory
 from nautilus_trader.data.engine import DataEngine
 from nautilus_trader.execution.engine import ExecutionEngine
 from nautilus_trader.model.currencies import ETH
@@ -35,6 +36,7 @@ from nautilus_trader.model.enums import OrderSide
 from nautilus_trader.model.enums import OrderStatus
 from nautilus_trader.model.identifiers import Venue
 from nautilus_trader.model.objects import Money
+from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
 from nautilus_trader.msgbus.bus import MessageBus
 from nautilus_trader.portfolio.portfolio import Portfolio
@@ -46,17 +48,39 @@ from tests.test_kit.stubs.identifiers import TestIdStubs
 
 
 FTX = Venue("FTX")
+DEFAULT_LEVERAGE = Decimal(100)
 ETHUSD_FTX = TestInstrumentProvider.ethusd_ftx()
+ETHUSD_FTX_ID = ETHUSD_FTX.id
+
+# Prices and quantities used to arrange orders and markets (at instrument precision)
+PRICE_3000 = Price.from_str("3000.0")
+PRICE_3050 = Price.from_str("3050.0")
+PRICE_3090 = Price.from_str("3090.0")
+PRICE_3100 = Price.from_str("3100.0")
+PRICE_3150 = Price.from_str("3150.0")
+PRICE_3151 = Price.from_str("3151.0")
+QTY_5 = Quantity.from_str("5.000")
+QTY_10 = Quantity.from_str("10.000")
+
+# Quote ticks are immutable, so the market used to arrange most tests is shared
+DEFAULT_TICK = QuoteTick(
+    instrument_id=ETHUSD_FTX_ID,
+    bid=Price.from_str("3090.2"),
+    ask=Price.from_str("3090.5"),
+    bid_size=Quantity.from_str("15.100"),
+    ask_size=Quantity.from_str("15.100"),
+    ts_event=0,
+    ts_init=0,
+)
 
 
 class TestSimulatedExchangeContingencyAdvancedOrders:
     def setup(self):
         # Fixture Setup
         self.clock = TestClock()
-        self.uuid_factory = UUIDFactory()
         self.logger = Logger(
             clock=self.clock,
-            level_stdout=LogLevel.INFO,
+            level_stdout=LogLevel.ERROR,
         )
 
         self.trader_id = TestIdStubs.trader_id()
@@ -104,7 +128,7 @@ class TestSimulatedExchangeContingencyAdvancedOrders:
             account_type=AccountType.MARGIN,
             base_currency=None,  # Multi-asset wallet
             starting_balances=[Money(200, ETH), Money(1_000_000, USD)],
-            default_leverage=Decimal(100),
+            default_leverage=DEFAULT_LEVERAGE,
             leverages={},
             is_frozen_account=False,
             instruments=[ETHUSD_FTX],
@@ -147,59 +171,28 @@ class TestSimulatedExchangeContingencyAdvancedOrders:
         self.exec_engine.start()
         self.strategy.start()
 
-    def test_submit_bracket_market_buy_accepts_sl_and_tp(self):
-        # Arrange: Prepare market
-        tick = QuoteTick(
-            instrument_id=ETHUSD_FTX.id,
-            bid=ETHUSD_FTX.make_price(3090.2),
-            ask=ETHUSD_FTX.make_price(3090.5),
-            bid_size=ETHUSD_FTX.make_qty(15.100),
-            ask_size=ETHUSD_FTX.make_qty(15.100),
-            ts_event=0,
-            ts_init=0,
-        )
-
+    def _process_quote_tick(self, tick):
+        # Update the cache (via the data engine) and the exchange market
         self.data_engine.process(tick)
         self.exchange.process_quote_tick(tick)
 
-        bracket = self.strategy.order_factory.bracket_market(
-            instrument_id=ETHUSD_FTX.id,
-            order_side=OrderSide.BUY,
-            quantity=ETHUSD_FTX.make_qty(10.000),
-            stop_loss=ETHUSD_FTX.make_price(3050.0),
-            take_profit=ETHUSD_FTX.make_price(3150.0),
-        )
-
-        # Act
-        self.strategy.submit_order_list(bracket)
-        self.exchange.process(0)
-
-        # Assert
-        assert bracket.orders[0].status == OrderStatus.FILLED
-        assert bracket.orders[1].status == OrderStatus.ACCEPTED
-        assert bracket.orders[2].status == OrderStatus.ACCEPTED
-
-    def test_submit_bracket_market_sell_accepts_sl_and_tp(self):
+    @pytest.mark.parametrize(
+        "side, sl, tp",
+        [
+            [OrderSide.BUY, PRICE_3050, PRICE_3150],
+            [OrderSide.SELL, PRICE_3150, PRICE_3050],
+        ],
+    )
+    def test_submit_bracket_market_accepts_sl_and_tp(self, side, sl, tp):
         # Arrange: Prepare market
-        tick = QuoteTick(
-            instrument_id=ETHUSD_FTX.id,
-            bid=ETHUSD_FTX.make_price(3090.2),
-            ask=ETHUSD_FTX.make_price(3090.5),
-            bid_size=ETHUSD_FTX.make_qty(15.100),
-            ask_size=ETHUSD_FTX.make_qty(15.100),
-            ts_event=0,
-            ts_init=0,
-        )
-
-        self.data_engine.process(tick)
-        self.exchange.process_quote_tick(tick)
+        self._process_quote_tick(DEFAULT_TICK)
 
         bracket = self.strategy.order_factory.bracket_market(
-            instrument_id=ETHUSD_FTX.id,
-            order_side=OrderSide.SELL,
-            quantity=ETHUSD_FTX.make_qty(10.000),
-            stop_loss=ETHUSD_FTX.make_price(3150.0),
-            take_profit=ETHUSD_FTX.make_price(3050.0),
+            instrument_id=ETHUSD_FTX_ID,
+            order_side=side,
+            quantity=QTY_10,
+            stop_loss=sl,
+            take_profit=tp,
         )
 
         # Act
@@ -211,130 +204,53 @@ class TestSimulatedExchangeContingencyAdvancedOrders:
         assert bracket.orders[1].status == OrderStatus.ACCEPTED
         assert bracket.orders[2].status == OrderStatus.ACCEPTED
 
-    def test_submit_bracket_limit_buy_has_sl_tp_pending(self):
+    @pytest.mark.parametrize(
+        "side, entry, sl, tp",
+        [
+            [OrderSide.BUY, PRICE_3090, PRICE_3050, PRICE_3150],
+            [OrderSide.SELL, PRICE_3100, PRICE_3150, PRICE_3050],
+        ],
+    )
+    def test_submit_bracket_limit_has_sl_tp_pending(self, side, entry, sl, tp):
         # Arrange: Prepare market
-        tick = QuoteTick(
-            instrument_id=ETHUSD_FTX.id,
-            bid=ETHUSD_FTX.make_price(3090.2),
-            ask=ETHUSD_FTX.make_price(3090.5),
-            bid_size=ETHUSD_FTX.make_qty(15.100),
-            ask_size=ETHUSD_FTX.make_qty(15.100),
-            ts_event=0,
-            ts_init=0,
-        )
-
-        self.data_engine.process(tick)
-        self.exchange.process_quote_tick(tick)
+        self._process_quote_tick(DEFAULT_TICK)
 
         bracket = self.strategy.order_factory.bracket_limit(
-            instrument_id=ETHUSD_FTX.id,
-            order_side=OrderSide.BUY,
-            quantity=ETHUSD_FTX.make_qty(10.000),
-            entry=ETHUSD_FTX.make_price(3090.0),
-            stop_loss=ETHUSD_FTX.make_price(3050.0),
-            take_profit=ETHUSD_FTX.make_price(3150.0),
+            instrument_id=ETHUSD_FTX_ID,
+            order_side=side,
+            quantity=QTY_10,
+            entry=entry,
+            stop_loss=sl,
+            take_profit=tp,
         )
 
         # Act
         self.strategy.submit_order_list(bracket)
         self.exchange.process(0)
-        #
-        # # Assert
-        assert bracket.orders[0].status == OrderStatus.ACCEPTED
-        assert bracket.orders[1].status == OrderStatus.SUBMITTED
-        assert bracket.orders[2].status == OrderStatus.SUBMITTED
-
-    def test_submit_bracket_limit_sell_has_sl_tp_pending(self):
-        # Arrange: Prepare market
-        tick = QuoteTick(
-            instrument_id=ETHUSD_FTX.id,
-            bid=ETHUSD_FTX.make_price(3090.2),
-            ask=ETHUSD_FTX.make_price(3090.5),
-            bid_size=ETHUSD_FTX.make_qty(15.100),
-            ask_size=ETHUSD_FTX.make_qty(15.100),
-            ts_event=0,
-            ts_init=0,
-        )
-
-        self.data_engine.process(tick)
-        self.exchange.process_quote_tick(tick)
 
-        bracket = self.strategy.order_factory.bracket_limit(
-            instrument_id=ETHUSD_FTX.id,
-            order_side=OrderSide.SELL,
-            quantity=ETHUSD_FTX.make_qty(10.000),
-            entry=ETHUSD_FTX.make_price(3100.0),
-            stop_loss=ETHUSD_FTX.make_price(3150.0),
-            take_profit=ETHUSD_FTX.make_price(3050.0),
-        )
-
-        # Act
-        self.strategy.submit_order_list(bracket)
-        self.exchange.process(0)
-        #
-        # # Assert
+        # Assert
         assert bracket.orders[0].status == OrderStatus.ACCEPTED
         assert bracket.orders[1].status == OrderStatus.SUBMITTED
         assert bracket.orders[2].status == OrderStatus.SUBMITTED
 
-    def test_submit_bracket_limit_buy_fills_then_triggers_sl_and_tp(self):
+    @pytest.mark.parametrize(
+        "side, entry, sl, tp",
+        [
+            [OrderSide.BUY, PRICE_3100, PRICE_3050, PRICE_3150],
+            [OrderSide.SELL, PRICE_3050, PRICE_3150, PRICE_3000],
+        ],
+    )
+    def test_submit_bracket_limit_fills_then_triggers_sl_and_tp(self, side, entry, sl, tp):
         # Arrange: Prepare market
-        tick = QuoteTick(
-            instrument_id=ETHUSD_FTX.id,
-            bid=ETHUSD_FTX.make_price(3090.2),
-            ask=ETHUSD_FTX.make_price(3090.5),
-            bid_size=ETHUSD_FTX.make_qty(15.100),
-            ask_size=ETHUSD_FTX.make_qty(15.100),
-            ts_event=0,
-            ts_init=0,
-        )
-
-        self.data_engine.process(tick)
-        self.exchange.process_quote_tick(tick)
-
-        bracket = self.strategy.order_factory.bracket_limit(
-            instrument_id=ETHUSD_FTX.id,
-            order_side=OrderSide.BUY,
-            quantity=ETHUSD_FTX.make_qty(10.000),
-            entry=ETHUSD_FTX.make_price(3100.0),
-            stop_loss=ETHUSD_FTX.make_price(3050.0),
-            take_profit=ETHUSD_FTX.make_price(3150.0),
-        )
-
-        # Act
-        self.strategy.submit_order_list(bracket)
-        self.exchange.process(0)
-
-        # Assert
-        assert bracket.orders[0].status == OrderStatus.FILLED
-        assert bracket.orders[1].status == OrderStatus.ACCEPTED
-        assert bracket.orders[2].status == OrderStatus.ACCEPTED
-        assert len(self.exchange.get_open_orders()) == 2
-        assert bracket.orders[1] in self.exchange.get_open_orders()
-        assert bracket.orders[2] in self.exchange.get_open_orders()
-
-    def test_submit_bracket_limit_sell_fills_then_triggers_sl_and_tp(self):
-        # Arrange: Prepare market
-        tick = QuoteTick(
-            instrument_id=ETHUSD_FTX.id,
-            bid=ETHUSD_FTX.make_price(3090.2),
-            ask=ETHUSD_FTX.make_price(3090.5),
-            bid_size=ETHUSD_FTX.make_qty(15.100),
-            ask_size=ETHUSD_FTX.make_qty(15.100),
-            ts_event=0,
-            ts_init=0,
-        )
-
-        self.data_engine.process(tick)
-        self.exchange.process_quote_tick(tick)
+        self._process_quote_tick(DEFAULT_TICK)
 
         bracket = self.strategy.order_factory.bracket_limit(
-            instrument_id=ETHUSD_FTX.id,
-            order_side=OrderSide.SELL,
-            quantity=ETHUSD_FTX.make_qty(10.000),
-            entry=ETHUSD_FTX.make_price(3050.0),
-            stop_loss=ETHUSD_FTX.make_price(3150.0),
-            take_profit=ETHUSD_FTX.make_price(3000.0),
+            instrument_id=ETHUSD_FTX_ID,
+            order_side=side,
+            quantity=QTY_10,
+            entry=entry,
+            stop_loss=sl,
+            take_profit=tp,
         )
 
         # Act
@@ -351,26 +267,15 @@ class TestSimulatedExchangeContingencyAdvancedOrders:
 
     def test_reject_bracket_entry_then_rejects_sl_and_tp(self):
         # Arrange: Prepare market
-        tick = QuoteTick(
-            instrument_id=ETHUSD_FTX.id,
-            bid=ETHUSD_FTX.make_price(3090.2),
-            ask=ETHUSD_FTX.make_price(3090.5),
-            bid_size=ETHUSD_FTX.make_qty(15.100),
-            ask_size=ETHUSD_FTX.make_qty(15.100),
-            ts_event=0,
-            ts_init=0,
-        )
-
-        self.data_engine.process(tick)
-        self.exchange.process_quote_tick(tick)
+        self._process_quote_tick(DEFAULT_TICK)
 
         bracket = self.strategy.order_factory.bracket_limit(
-            instrument_id=ETHUSD_FTX.id,
+            instrument_id=ETHUSD_FTX_ID,
             order_side=OrderSide.SELL,
-            quantity=ETHUSD_FTX.make_qty(10.000),
-            entry=ETHUSD_FTX.make_price(3050.0),  # <-- in the market
-            stop_loss=ETHUSD_FTX.make_price(3150.0),
-            take_profit=ETHUSD_FTX.make_price(3000.0),
+            quantity=QTY_10,
+            entry=PRICE_3050,  # <-- in the market
+            stop_loss=PRICE_3150,
+            take_profit=PRICE_3000,
             post_only=True,  # <-- will reject placed into the market
         )
 
@@ -388,37 +293,26 @@ class TestSimulatedExchangeContingencyAdvancedOrders:
 
     def test_filling_bracket_sl_cancels_tp_order(self):
         # Arrange: Prepare market
-        tick1 = QuoteTick(
-            instrument_id=ETHUSD_FTX.id,
-            bid=ETHUSD_FTX.make_price(3090.2),
-            ask=ETHUSD_FTX.make_price(3090.5),
-            bid_size=ETHUSD_FTX.make_qty(15.100),
-            ask_size=ETHUSD_FTX.make_qty(15.100),
-            ts_event=0,
-            ts_init=0,
-        )
-
-        self.data_engine.process(tick1)
-        self.exchange.process_quote_tick(tick1)
+        self._process_quote_tick(DEFAULT_TICK)
 
         bracket = self.strategy.order_factory.bracket_limit(
-            instrument_id=ETHUSD_FTX.id,
+            instrument_id=ETHUSD_FTX_ID,
             order_side=OrderSide.BUY,
-            quantity=ETHUSD_FTX.make_qty(10.000),
-            entry=ETHUSD_FTX.make_price(3100.0),
-            stop_loss=ETHUSD_FTX.make_price(3050.0),
-            take_profit=ETHUSD_FTX.make_price(3150.0),
+            quantity=QTY_10,
+            entry=PRICE_3100,
+            stop_loss=PRICE_3050,
+            take_profit=PRICE_3150,
         )
 
         self.strategy.submit_order_list(bracket)
         self.exchange.process(0)
 
         tick2 = QuoteTick(
-            instrument_id=ETHUSD_FTX.id,
-            bid=ETHUSD_FTX.make_price(3150.0),
-            ask=ETHUSD_FTX.make_price(3151.0),
-            bid_size=ETHUSD_FTX.make_qty(10.000),
-            ask_size=ETHUSD_FTX.make_qty(10.000),
+            instrument_id=ETHUSD_FTX_ID,
+            bid=PRICE_3150,
+            ask=PRICE_3151,
+            bid_size=QTY_10,
+            ask_size=QTY_10,
             ts_event=0,
             ts_init=0,
         )
@@ -435,26 +329,15 @@ class TestSimulatedExchangeContingencyAdvancedOrders:
 
     def test_filling_bracket_tp_cancels_sl_order(self):
         # Arrange: Prepare market
-        tick1 = QuoteTick(
-            instrument_id=ETHUSD_FTX.id,
-            bid=ETHUSD_FTX.make_price(3090.2),
-            ask=ETHUSD_FTX.make_price(3090.5),
-            bid_size=ETHUSD_FTX.make_qty(15.100),
-            ask_size=ETHUSD_FTX.make_qty(15.100),
-            ts_event=0,
-            ts_init=0,
-        )
-
-        self.data_engine.process(tick1)
-        self.exchange.process_quote_tick(tick1)
+        self._process_quote_tick(DEFAULT_TICK)
 
         bracket = self.strategy.order_factory.bracket_limit(
-            instrument_id=ETHUSD_FTX.id,
+            instrument_id=ETHUSD_FTX_ID,
             order_side=OrderSide.BUY,
-            quantity=ETHUSD_FTX.make_qty(10.000),
-            entry=ETHUSD_FTX.make_price(3100.0),
-            stop_loss=ETHUSD_FTX.make_price(3050.0),
-            take_profit=ETHUSD_FTX.make_price(3150.0),
+            quantity=QTY_10,
+            entry=PRICE_3100,
+            stop_loss=PRICE_3050,
+            take_profit=PRICE_3150,
         )
 
         self.strategy.submit_order_list(bracket)
@@ -462,11 +345,11 @@ class TestSimulatedExchangeContingencyAdvancedOrders:
 
         # Act
         tick2 = QuoteTick(
-            instrument_id=ETHUSD_FTX.id,
-            bid=ETHUSD_FTX.make_price(3150.0),
-            ask=ETHUSD_FTX.make_price(3151.0),
-            bid_size=ETHUSD_FTX.make_qty(10.000),
-            ask_size=ETHUSD_FTX.make_qty(10.000),
+            instrument_id=ETHUSD_FTX_ID,
+            bid=PRICE_3150,
+            ask=PRICE_3151,
+            bid_size=QTY_10,
+            ask_size=QTY_10,
             ts_event=0,
             ts_init=0,
         )
@@ -482,26 +365,15 @@ class TestSimulatedExchangeContingencyAdvancedOrders:
 
     def test_partial_fill_bracket_tp_updates_sl_order(self):
         # Arrange: Prepare market
-        tick1 = QuoteTick(
-            instrument_id=ETHUSD_FTX.id,
-            bid=ETHUSD_FTX.make_price(3090.2),
-            ask=ETHUSD_FTX.make_price(3090.5),
-            bid_size=ETHUSD_FTX.make_qty(15.100),
-            ask_size=ETHUSD_FTX.make_qty(15.100),
-            ts_event=0,
-            ts_init=0,
-        )
-
-        self.data_engine.process(tick1)
-        self.exchange.process_quote_tick(tick1)
+        self._process_quote_tick(DEFAULT_TICK)
 
         bracket = self.strategy.order_factory.bracket_limit(
-            instrument_id=ETHUSD_FTX.id,
+            instrument_id=ETHUSD_FTX_ID,
             order_side=OrderSide.BUY,
-            quantity=ETHUSD_FTX.make_qty(10.000),
-            entry=ETHUSD_FTX.make_price(3100.0),
-            stop_loss=ETHUSD_FTX.make_price(3050.0),
-            take_profit=ETHUSD_FTX.make_price(3150.0),
+            quantity=QTY_10,
+            entry=PRICE_3100,
+            stop_loss=PRICE_3050,
+            take_profit=PRICE_3150,
         )
 
         en = bracket.orders[0]
@@ -513,11 +385,11 @@ class TestSimulatedExchangeContingencyAdvancedOrders:
 
         # Act
         tick2 = QuoteTick(
-            instrument_id=ETHUSD_FTX.id,
-            bid=ETHUSD_FTX.make_price(3150.0),
-            ask=ETHUSD_FTX.make_price(3151.0),
-            bid_size=ETHUSD_FTX.make_qty(5.000),
-            ask_size=ETHUSD_FTX.make_qty(5.1000),
+            instrument_id=ETHUSD_FTX_ID,
+            bid=PRICE_3150,
+            ask=PRICE_3151,
+            bid_size=QTY_5,
+            ask_size=Quantity.from_str("5.100"),
             ts_event=0,
             ts_init=0,
         )
@@ -536,26 +408,15 @@ class TestSimulatedExchangeContingencyAdvancedOrders:
 
     def test_modifying_bracket_tp_updates_sl_order(self):
         # Arrange: Prepare market
-        tick1 = QuoteTick(
-            instrument_id=ETHUSD_FTX.id,
-            bid=ETHUSD_FTX.make_price(3090.2),
-            ask=ETHUSD_FTX.make_price(3090.5),
-            bid_size=ETHUSD_FTX.make_qty(15.100),
-            ask_size=ETHUSD_FTX.make_qty(15.100),
-            ts_event=0,
-            ts_init=0,
-        )
-
-        self.data_engine.process(tick1)
-        self.exchange.process_quote_tick(tick1)
+        self._process_quote_tick(DEFAULT_TICK)
 
         bracket = self.strategy.order_factory.bracket_limit(
-            instrument_id=ETHUSD_FTX.id,
+            instrument_id=ETHUSD_FTX_ID,
             order_side=OrderSide.BUY,
-            quantity=ETHUSD_FTX.make_qty(10.000),
-            entry=ETHUSD_FTX.make_price(3100.0),
-            stop_loss=ETHUSD_FTX.make_price(3050.0),
-            take_profit=ETHUSD_FTX.make_price(3150.0),
+            quantity=QTY_10,
+            entry=PRICE_3100,
+            stop_loss=PRICE_3050,
+            take_profit=PRICE_3150,
         )
 
         en = bracket.orders[0]
@@ -584,25 +445,14 @@ class TestSimulatedExchangeContingencyAdvancedOrders:
 
     def test_closing_position_cancels_bracket_ocos(self):
         # Arrange: Prepare market
-        tick1 = QuoteTick(
-            instrument_id=ETHUSD_FTX.id,
-            bid=ETHUSD_FTX.make_price(3090.2),
-            ask=ETHUSD_FTX.make_price(3090.5),
-            bid_size=ETHUSD_FTX.make_qty(15.100),
-            ask_size=ETHUSD_FTX.make_qty(15.100),
-            ts_event=0,
-            ts_init=0,
-        )
-
-        self.data_engine.process(tick1)
-        self.exchange.process_quote_tick(tick1)
+        self._process_quote_tick(DEFAULT_TICK)
 
         bracket = self.strategy.order_factory.bracket_market(
-            instrument_id=ETHUSD_FTX.id,
+            instrument_id=ETHUSD_FTX_ID,
             order_side=OrderSide.BUY,
-            quantity=ETHUSD_FTX.make_qty(10.000),
-            stop_loss=ETHUSD_FTX.make_price(3050.0),
-            take_profit=ETHUSD_FTX.make_price(3150.0),
+            quantity=QTY_10,
+            stop_loss=PRICE_3050,
+            take_profit=PRICE_3150,
         )
 
         en = bracket.orders[0]
@@ -625,25 +475,14 @@ class TestSimulatedExchangeContingencyAdvancedOrders:
 
     def test_partially_filling_position_updates_bracket_ocos(self):
         # Arrange: Prepare market
-        tick1 = QuoteTick(
-            instrument_id=ETHUSD_FTX.id,
-            bid=ETHUSD_FTX.make_price(3090.2),
-            ask=ETHUSD_FTX.make_price(3090.5),
-            bid_size=ETHUSD_FTX.make_qty(15.100),
-            ask_size=ETHUSD_FTX.make_qty(15.100),
-            ts_event=0,
-            ts_init=0,
-        )
-
-        self.data_engine.process(tick1)
-        self.exchange.process_quote_tick(tick1)
+        self._process_quote_tick(DEFAULT_TICK)
 
         bracket = self.strategy.order_factory.bracket_market(
-            instrument_id=ETHUSD_FTX.id,
+            instrument_id=ETHUSD_FTX_ID,
             order_side=OrderSide.BUY,
-            quantity=ETHUSD_FTX.make_qty(10.000),
-            stop_loss=ETHUSD_FTX.make_price(3050.0),
-            take_profit=ETHUSD_FTX.make_price(3150.0),
+            quantity=QTY_10,
+            stop_loss=PRICE_3050,
+            take_profit=PRICE_3150,
         )
 
         en = bracket.orders[0]
@@ -655,9 +494,9 @@ class TestSimulatedExchangeContingencyAdvancedOrders:
 
         # Act
         reduce_order = self.strategy.order_factory.market(
-            instrument_id=ETHUSD_FTX.id,
+            instrument_id=ETHUSD_FTX_ID,
             order_side=OrderSide.SELL,
-            quantity=ETHUSD_FTX.make_qty(5.000),
+            quantity=QTY_5,
         )
         self.strategy.submit_order(
             reduce_order,
@@ -669,7 +508,7 @@ class TestSimulatedExchangeContingencyAdvancedOrders:
         assert en.status == OrderStatus.FILLED
         assert sl.status == OrderStatus.ACCEPTED
         assert tp.status == OrderStatus.ACCEPTED
-        assert sl.quantity == ETHUSD_FTX.make_qty(5.000)
-        assert tp.quantity == ETHUSD_FTX.make_qty(5.000)
+        assert sl.quantity == QTY_5
+        assert tp.quantity == QTY_5
         assert len(self.exchange.get_open_orders()) == 2
         assert len(self.exchange.cache.positions_open()) == 1
@@ -15,6 +15,8 @@
 
 from decimal import Decimal
 
+import numpy as np
+
 from nautilus_trader.backtest.data.providers import TestInstrumentProvider
 from nautilus_trader.indicators.average.ema import ExponentialMovingAverage
 from nautilus_trader.model.enums import PriceType
@@ -125,6 +127,39 @@ class TestExponentialMovingAverage:
         # Act, Assert
         assert self.ema.value == 1.5123966942148757
 
+    def test_update_raw_array_with_three_inputs_returns_expected_value(self):
+        # Arrange, Act
+        self.ema.update_raw_array(np.array([1.0, 2.0, 3.0]))
+
+        # Assert
+        assert self.ema.count == 3
+        assert self.ema.value == 1.5123966942148757
+
+    def test_update_raw_array_with_no_inputs_does_nothing(self):
+        # Arrange, Act
+        self.ema.update_raw_array(np.array([], dtype=np.float64))
+
+        # Assert
+        assert not self.ema.has_inputs
+        assert self.ema.value == 0.0
+
+    def test_update_raw_array_matches_update_raw_in_sequence(self):
+        # Arrange
+        values = np.random.default_rng(42).normal(1.0, 0.01, size=25)
+        expected = ExponentialMovingAverage(10)
+        expected.update_raw(1.0)
+        for value in values:
+            expected.update_raw(value)
+
+        # Act
+        self.ema.update_raw(1.0)
+        self.ema.update_raw_array(values)
+
+        # Assert
+        assert self.ema.count == expected.count
+        assert self.ema.initialized
+        assert self.ema.value == expected.value
+
     def test_reset_successfully_returns_indicator_to_fresh_state(self):
         # Arrange
         for _i in range(1000):
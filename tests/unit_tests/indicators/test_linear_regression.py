@@ -13,14 +13,13 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from nautilus_trader.backtest.data.providers import TestInstrumentProvider
+import numpy as np
+import pytest
+
 from nautilus_trader.indicators.linear_regression import LinearRegression
 from tests.test_kit.stubs.data import TestDataStubs
 
 
-AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
-
-
 class TestLinearRegression:
     def setup(self):
         # Fixture Setup
@@ -37,13 +36,14 @@ class TestLinearRegression:
         assert self.linear_regression.name == "LinearRegression"
 
     def test_handle_bar_updates_indicator(self):
+        bar = TestDataStubs.bar_5decimal()
         for _ in range(self.period):
-            self.linear_regression.handle_bar(TestDataStubs.bar_5decimal())
+            self.linear_regression.handle_bar(bar)
 
         assert self.linear_regression.has_inputs
-        assert self.linear_regression.value == 1.500045
-        assert self.linear_regression.slope == 0.25000750000000005
-        assert self.linear_regression.intercept == 0.7500224999999999
+        assert self.linear_regression.value == 1.00003
+        assert self.linear_regression.slope == 0.0
+        assert self.linear_regression.intercept == 1.00003
 
     def test_value_with_one_input(self):
         self.linear_regression.update_raw(1.00000)
@@ -63,9 +63,51 @@ class TestLinearRegression:
         self.linear_regression.update_raw(9.00000)
         self.linear_regression.update_raw(10.00000)
 
-        assert self.linear_regression.value == 14.0
-        assert self.linear_regression.slope == 2.75
-        assert self.linear_regression.intercept == 5.75
+        assert self.linear_regression.value == 10.0
+        assert self.linear_regression.slope == 1.0
+        assert self.linear_regression.intercept == 7.0
+
+    def test_update_raw_array_with_ten_inputs(self):
+        # Arrange, Act
+        self.linear_regression.update_raw_array(np.arange(1.0, 11.0))
+
+        # Assert
+        assert self.linear_regression.value == 10.0
+        assert self.linear_regression.slope == 1.0
+        assert self.linear_regression.intercept == 7.0
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            np.arange(1.0, 11.0),
+            np.linspace(0.0, 1.0, 20),
+            np.random.RandomState(0).randn(50),
+        ],
+    )
+    def test_values_match_numpy_least_squares_fit(self, data):
+        # Arrange
+        linear_regression = LinearRegression(period=len(data))
+        slope, intercept = np.polyfit(np.arange(len(data)), data, 1)
+
+        # Act
+        linear_regression.update_raw_array(data)
+
+        # Assert
+        assert linear_regression.slope == pytest.approx(slope)
+        assert linear_regression.intercept == pytest.approx(intercept)
+        assert linear_regression.value == pytest.approx(slope * (len(data) - 1) + intercept)
+
+    def test_values_match_numpy_least_squares_fit_over_sliding_window(self):
+        # Arrange
+        data = 100.0 + np.random.RandomState(1).randn(1_000).cumsum()
+        slope, intercept = np.polyfit(np.arange(self.period), data[-self.period :], 1)
+
+        # Act
+        self.linear_regression.update_raw_array(data)
+
+        # Assert
+        assert self.linear_regression.slope == pytest.approx(slope)
+        assert self.linear_regression.intercept == pytest.approx(intercept)
 
     def test_reset(self):
         self.linear_regression.update_raw(1.00000)
@@ -24,36 +24,30 @@ from nautilus_trader.common.logging import Logger
 from nautilus_trader.common.uuid import UUIDFactory
 from nautilus_trader.config import LiveRiskEngineConfig
 from nautilus_trader.execution.messages import SubmitOrder
-from nautilus_trader.live.data_engine import LiveDataEngine
 from nautilus_trader.live.execution_engine import LiveExecutionEngine
 from nautilus_trader.live.risk_engine import LiveRiskEngine
-from nautilus_trader.model.currencies import USD
-from nautilus_trader.model.enums import AccountType
 from nautilus_trader.model.enums import OrderSide
-from nautilus_trader.model.identifiers import ClientId
 from nautilus_trader.model.identifiers import StrategyId
 from nautilus_trader.model.identifiers import TraderId
-from nautilus_trader.model.identifiers import Venue
 from nautilus_trader.model.objects import Quantity
 from nautilus_trader.msgbus.bus import MessageBus
 from nautilus_trader.portfolio.portfolio import Portfolio
 from nautilus_trader.trading.strategy import Strategy
-from tests.test_kit.mocks.exec_clients import MockExecutionClient
+from tests.test_kit.functions import eventually
 from tests.test_kit.stubs.component import TestComponentStubs
 from tests.test_kit.stubs.events import TestEventStubs
 from tests.test_kit.stubs.identifiers import TestIdStubs
 
 
-SIM = Venue("SIM")
 AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
 GBPUSD_SIM = TestInstrumentProvider.default_fx_ccy("GBP/USD")
 
 
 class TestLiveRiskEngine:
-    def setup(self):
+    @pytest.fixture(autouse=True)
+    def setup(self, event_loop):
         # Fixture Setup
-        self.loop = asyncio.get_event_loop()
-        self.loop.set_debug(True)
+        self.loop = event_loop
 
         self.clock = LiveClock()
         self.uuid_factory = UUIDFactory()
@@ -89,14 +83,6 @@ class TestLiveRiskEngine:
             logger=self.logger,
         )
 
-        self.data_engine = LiveDataEngine(
-            loop=self.loop,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-            logger=self.logger,
-        )
-
         self.exec_engine = LiveExecutionEngine(
             loop=self.loop,
             msgbus=self.msgbus,
@@ -114,19 +100,33 @@ class TestLiveRiskEngine:
             logger=self.logger,
         )
 
-        self.exec_client = MockExecutionClient(
-            client_id=ClientId("SIM"),
-            venue=SIM,
-            account_type=AccountType.MARGIN,
-            base_currency=USD,
+        self.strategy = Strategy()
+        self.strategy.register(
+            trader_id=self.trader_id,
+            portfolio=self.portfolio,
             msgbus=self.msgbus,
             cache=self.cache,
             clock=self.clock,
             logger=self.logger,
         )
 
-        # Wire up components
-        self.exec_engine.register_client(self.exec_client)
+    def _market_order(self):
+        return self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+        )
+
+    def _submit_order_command(self):
+        return SubmitOrder(
+            self.trader_id,
+            self.strategy.id,
+            None,
+            True,
+            self._market_order(),
+            self.uuid_factory.generate(),
+            self.clock.timestamp_ns(),
+        )
 
     @pytest.mark.asyncio
     async def test_start_when_loop_not_running_logs(self):
@@ -159,41 +159,23 @@ class TestLiveRiskEngine:
             config=LiveRiskEngineConfig(qsize=1),
         )
 
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-            logger=self.logger,
-        )
-
-        order = strategy.order_factory.market(
-            AUDUSD_SIM.id,
-            OrderSide.BUY,
-            Quantity.from_int(100000),
-        )
-
-        submit_order = SubmitOrder(
-            self.trader_id,
-            strategy.id,
-            None,
-            True,
-            order,
-            self.uuid_factory.generate(),
-            self.clock.timestamp_ns(),
-        )
+        submit_order = self._submit_order_command()
 
         # Act
         self.risk_engine.execute(submit_order)
         self.risk_engine.execute(submit_order)
-        await asyncio.sleep(0.1)
+        await asyncio.sleep(0)  # Run the blocked put (engine not started, so nothing drains)
 
         # Assert
         assert self.risk_engine.qsize() == 1
         assert self.risk_engine.command_count == 0
 
+        # Tear Down (drain the blocked put so no task is pending when the loop closes)
+        self.risk_engine.start()
+        await eventually(lambda: self.risk_engine.command_count == 2)
+        self.risk_engine.stop()
+        await self.risk_engine.get_run_queue_task()
+
     @pytest.mark.asyncio
     async def test_message_qsize_at_max_blocks_on_put_event(self):
         # Arrange
@@ -208,48 +190,62 @@ class TestLiveRiskEngine:
             config=LiveRiskEngineConfig(qsize=1),
         )
 
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
+        submit_order = self._submit_order_command()
+        event = TestEventStubs.order_submitted(submit_order.order)
+
+        # Act
+        self.risk_engine.execute(submit_order)
+        self.risk_engine.process(event)  # Add over max size
+        await asyncio.sleep(0)  # Run the blocked put (engine not started, so nothing drains)
+
+        # Assert
+        assert self.risk_engine.qsize() == 1
+        assert self.risk_engine.event_count == 0
+
+        # Tear Down (drain the blocked put so no task is pending when the loop closes)
+        self.risk_engine.start()
+        await eventually(lambda: self.risk_engine.event_count == 1)
+        self.risk_engine.stop()
+        await self.risk_engine.get_run_queue_task()
+
+    @pytest.mark.asyncio
+    async def test_message_qsize_at_max_processes_blocked_event_when_started(self):
+        # Arrange
+        self.msgbus.deregister("RiskEngine.execute", self.risk_engine.execute)
+        self.risk_engine = LiveRiskEngine(
+            loop=self.loop,
             portfolio=self.portfolio,
             msgbus=self.msgbus,
             cache=self.cache,
             clock=self.clock,
             logger=self.logger,
+            config=LiveRiskEngineConfig(qsize=1),
         )
 
-        order = strategy.order_factory.market(
-            AUDUSD_SIM.id,
-            OrderSide.BUY,
-            Quantity.from_int(100000),
-        )
-
-        submit_order = SubmitOrder(
-            self.trader_id,
-            strategy.id,
-            None,
-            True,
-            order,
-            self.uuid_factory.generate(),
-            self.clock.timestamp_ns(),
-        )
-
-        event = TestEventStubs.order_submitted(order)
+        submit_order = self._submit_order_command()
+        event = TestEventStubs.order_submitted(submit_order.order)
 
-        # Act
         self.risk_engine.execute(submit_order)
         self.risk_engine.process(event)  # Add over max size
-        await asyncio.sleep(0.1)
+
+        # Act
+        self.risk_engine.start()
+        await eventually(lambda: self.risk_engine.event_count == 1)
 
         # Assert
-        assert self.risk_engine.qsize() == 1
-        assert self.risk_engine.event_count == 0
+        assert self.risk_engine.qsize() == 0
+        assert self.risk_engine.command_count == 1
+        assert self.risk_engine.event_count == 1
+
+        # Tear Down
+        self.risk_engine.stop()
+        await self.risk_engine.get_run_queue_task()
 
     @pytest.mark.asyncio
     async def test_start(self):
         # Arrange, Act
         self.risk_engine.start()
-        await asyncio.sleep(0.1)
+        await eventually(lambda: self.risk_engine.is_running)
 
         # Assert
         assert self.risk_engine.is_running
@@ -280,35 +276,11 @@ class TestLiveRiskEngine:
         # Arrange
         self.risk_engine.start()
 
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-            logger=self.logger,
-        )
-
-        order = strategy.order_factory.market(
-            AUDUSD_SIM.id,
-            OrderSide.BUY,
-            Quantity.from_int(100000),
-        )
-
-        submit_order = SubmitOrder(
-            self.trader_id,
-            strategy.id,
-            None,
-            True,
-            order,
-            self.uuid_factory.generate(),
-            self.clock.timestamp_ns(),
-        )
+        submit_order = self._submit_order_command()
 
         # Act
         self.risk_engine.execute(submit_order)
-        await asyncio.sleep(0.1)
+        await eventually(lambda: self.risk_engine.command_count == 1)
 
         # Assert
         assert self.risk_engine.qsize() == 0
@@ -319,31 +291,35 @@ class TestLiveRiskEngine:
         await self.risk_engine.get_run_queue_task()
 
     @pytest.mark.asyncio
-    async def test_handle_position_opening_with_position_id_none(self):
+    async def test_execute_multiple_commands_processes_all_from_queue(self):
         # Arrange
         self.risk_engine.start()
 
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-            logger=self.logger,
-        )
+        commands = [self._submit_order_command() for _ in range(100)]
 
-        order = strategy.order_factory.market(
-            AUDUSD_SIM.id,
-            OrderSide.BUY,
-            Quantity.from_int(100000),
-        )
+        # Act
+        for command in commands:
+            self.risk_engine.execute(command)
+        await eventually(lambda: self.risk_engine.command_count == 100)
+
+        # Assert
+        assert self.risk_engine.qsize() == 0
+        assert self.risk_engine.command_count == 100
+
+        # Tear Down
+        self.risk_engine.stop()
+        await self.risk_engine.get_run_queue_task()
+
+    @pytest.mark.asyncio
+    async def test_handle_position_opening_with_position_id_none(self):
+        # Arrange
+        self.risk_engine.start()
 
-        event = TestEventStubs.order_submitted(order)
+        event = TestEventStubs.order_submitted(self._market_order())
 
         # Act
         self.risk_engine.process(event)
-        await asyncio.sleep(0.1)
+        await eventually(lambda: self.risk_engine.event_count == 1)
 
         # Assert
         assert self.risk_engine.qsize() == 0
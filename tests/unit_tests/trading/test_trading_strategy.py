@@ -13,12 +13,10 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from datetime import datetime
 from datetime import timedelta
 from decimal import Decimal
 
 import pytest
-import pytz
 
 from nautilus_trader.backtest.data.providers import TestInstrumentProvider
 from nautilus_trader.backtest.data_client import BacktestMarketDataClient
@@ -30,13 +28,11 @@ from nautilus_trader.common.clock import TestClock
 from nautilus_trader.common.enums import ComponentState
 from nautilus_trader.common.enums import LogLevel
 from nautilus_trader.common.logging import Logger
-from nautilus_trader.common.uuid import UUIDFactory
 from nautilus_trader.config import StrategyConfig
 from nautilus_trader.data.engine import DataEngine
 from nautilus_trader.execution.engine import ExecutionEngine
 from nautilus_trader.indicators.average.ema import ExponentialMovingAverage
 from nautilus_trader.model.currencies import USD
-from nautilus_trader.model.data.bar import Bar
 from nautilus_trader.model.enums import AccountType
 from nautilus_trader.model.enums import OMSType
 from nautilus_trader.model.enums import OrderSide
@@ -61,19 +57,101 @@ from tests.test_kit.stubs.events import TestEventStubs
 from tests.test_kit.stubs.identifiers import TestIdStubs
 
 
+DEFAULT_LEVERAGE = Decimal(50)
+
 AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
 GBPUSD_SIM = TestInstrumentProvider.default_fx_ccy("GBP/USD")
 USDJPY_SIM = TestInstrumentProvider.default_fx_ccy("USD/JPY")
 
+# Immutable order prices and quantities shared across the order tests (USD/JPY)
+PRICE_90_000 = Price.from_str("90.000")
+PRICE_90_001 = Price.from_str("90.001")
+PRICE_90_006 = Price.from_str("90.006")
+PRICE_90_007 = Price.from_str("90.007")
+PRICE_90_500 = Price.from_str("90.500")
+QTY_100000 = Quantity.from_int(100000)
+QTY_110000 = Quantity.from_int(110000)
+
+# Immutable market data shared across the handler tests
+QUOTE_TICK_AUDUSD = TestDataStubs.quote_tick_5decimal(AUDUSD_SIM.id)
+TRADE_TICK_AUDUSD = TestDataStubs.trade_tick_5decimal(AUDUSD_SIM.id)
+BAR_AUDUSD = TestDataStubs.bar_5decimal()
+
+
+class TestUnregisteredStrategy:
+    def test_strategy_equality(self):
+        # Arrange
+        strategy1 = Strategy(config=StrategyConfig(order_id_tag="AUD/USD-001"))
+        strategy2 = Strategy(config=StrategyConfig(order_id_tag="AUD/USD-001"))
+        strategy3 = Strategy(config=StrategyConfig(order_id_tag="AUD/USD-002"))
+
+        # Act, Assert
+        assert strategy1 == strategy1
+        assert strategy1 == strategy2
+        assert strategy2 != strategy3
+
+    def test_str_and_repr(self):
+        # Arrange
+        strategy = Strategy(config=StrategyConfig(order_id_tag="GBP/USD-MM"))
+
+        # Act, Assert
+        assert str(strategy) == "Strategy-GBP/USD-MM"
+        assert repr(strategy) == "Strategy(Strategy-GBP/USD-MM)"
+
+    def test_id(self):
+        # Arrange
+        strategy = Strategy()
+
+        # Act, Assert
+        assert strategy.id == StrategyId("Strategy-000")
+
+    def test_initialization(self):
+        # Arrange
+        strategy = Strategy(config=StrategyConfig(order_id_tag="001"))
+
+        # Act, Assert
+        assert strategy.state == ComponentState.PRE_INITIALIZED
+        assert not strategy.indicators_initialized()
+
+    def test_on_save_when_not_overridden_does_nothing(self):
+        # Arrange
+        strategy = Strategy()
+
+        # Act
+        strategy.on_save()
+
+        # Assert
+        assert True  # Exception not raised
+
+    def test_on_load_when_not_overridden_does_nothing(self):
+        # Arrange
+        strategy = Strategy()
+
+        # Act
+        strategy.on_load({})
+
+        # Assert
+        assert True  # Exception not raised
+
+    def test_save_when_not_registered_logs_error(self):
+        # Arrange
+        config = StrategyConfig()
+
+        strategy = Strategy(config)
+        strategy.save()
+
+        # Assert
+        assert True  # Exception not raised
+
 
 class TestStrategy:
+    @pytest.fixture(autouse=True)
     def setup(self):
         # Fixture Setup
         self.clock = TestClock()
-        self.uuid_factory = UUIDFactory()
         self.logger = Logger(
             clock=self.clock,
-            level_stdout=LogLevel.DEBUG,
+            level_stdout=LogLevel.ERROR,
         )
 
         self.trader_id = TestIdStubs.trader_id()
@@ -121,7 +199,7 @@ class TestStrategy:
             account_type=AccountType.MARGIN,
             base_currency=USD,
             starting_balances=[Money(1_000_000, USD)],
-            default_leverage=Decimal(50),
+            default_leverage=DEFAULT_LEVERAGE,
             leverages={},
             is_frozen_account=False,
             cache=self.cache,
@@ -153,15 +231,11 @@ class TestStrategy:
         self.exchange.register_client(self.exec_client)
         self.data_engine.register_client(self.data_client)
         self.exec_engine.register_client(self.exec_client)
-        self.exchange.reset()
+        self.exchange.initialize_account()
 
-        # Add instruments
-        self.data_engine.process(AUDUSD_SIM)
-        self.data_engine.process(GBPUSD_SIM)
-        self.data_engine.process(USDJPY_SIM)
-        self.cache.add_instrument(AUDUSD_SIM)
-        self.cache.add_instrument(GBPUSD_SIM)
-        self.cache.add_instrument(USDJPY_SIM)
+        # Add instruments (the data engine also adds them to the cache)
+        for instrument in (AUDUSD_SIM, GBPUSD_SIM, USDJPY_SIM):
+            self.data_engine.process(instrument)
 
         self.exchange.process_quote_tick(
             TestDataStubs.quote_tick_3decimal(USDJPY_SIM.id)
@@ -170,73 +244,7 @@ class TestStrategy:
         self.data_engine.start()
         self.exec_engine.start()
 
-    def test_strategy_equality(self):
-        # Arrange
-        strategy1 = Strategy(config=StrategyConfig(order_id_tag="AUD/USD-001"))
-        strategy2 = Strategy(config=StrategyConfig(order_id_tag="AUD/USD-001"))
-        strategy3 = Strategy(config=StrategyConfig(order_id_tag="AUD/USD-002"))
-
-        # Act, Assert
-        assert strategy1 == strategy1
-        assert strategy1 == strategy2
-        assert strategy2 != strategy3
-
-    def test_str_and_repr(self):
-        # Arrange
-        strategy = Strategy(config=StrategyConfig(order_id_tag="GBP/USD-MM"))
-
-        # Act, Assert
-        assert str(strategy) == "Strategy-GBP/USD-MM"
-        assert repr(strategy) == "Strategy(Strategy-GBP/USD-MM)"
-
-    def test_id(self):
-        # Arrange
-        strategy = Strategy()
-
-        # Act, Assert
-        assert strategy.id == StrategyId("Strategy-000")
-
-    def test_initialization(self):
-        # Arrange
-        strategy = Strategy(config=StrategyConfig(order_id_tag="001"))
-
-        # Act, Assert
-        assert strategy.state == ComponentState.PRE_INITIALIZED
-        assert not strategy.indicators_initialized()
-
-    def test_on_save_when_not_overridden_does_nothing(self):
-        # Arrange
-        strategy = Strategy()
-
-        # Act
-        strategy.on_save()
-
-        # Assert
-        assert True  # Exception not raised
-
-    def test_on_load_when_not_overridden_does_nothing(self):
-        # Arrange
-        strategy = Strategy()
-
-        # Act
-        strategy.on_load({})
-
-        # Assert
-        assert True  # Exception not raised
-
-    def test_save_when_not_registered_logs_error(self):
-        # Arrange
-        config = StrategyConfig()
-
-        strategy = Strategy(config)
-        strategy.save()
-
-        # Assert
-        assert True  # Exception not raised
-
-    def test_save_when_user_code_raises_error_logs_and_reraises(self):
-        # Arrange
-        strategy = KaboomStrategy()
+    def _register(self, strategy):
         strategy.register(
             trader_id=self.trader_id,
             portfolio=self.portfolio,
@@ -246,6 +254,17 @@ class TestStrategy:
             logger=self.logger,
         )
 
+    @pytest.fixture()
+    def strategy(self):
+        strategy = Strategy()
+        self._register(strategy)
+        return strategy
+
+    def test_save_when_user_code_raises_error_logs_and_reraises(self):
+        # Arrange
+        strategy = KaboomStrategy()
+        self._register(strategy)
+
         # Act, Assert
         with pytest.raises(RuntimeError):
             strategy.save()
@@ -253,31 +272,14 @@ class TestStrategy:
     def test_load_when_user_code_raises_error_logs_and_reraises(self):
         # Arrange
         strategy = KaboomStrategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-            logger=self.logger,
-        )
+        self._register(strategy)
 
         # Act, Assert
         with pytest.raises(RuntimeError):
             strategy.load({"something": b"123456"})
 
-    def test_load(self):
+    def test_load(self, strategy):
         # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-            logger=self.logger,
-        )
-
         state = {}
 
         # Act
@@ -291,27 +293,9 @@ class TestStrategy:
         # Arrange
         bar_type = TestDataStubs.bartype_audusd_1min_bid()
         strategy = MockStrategy(bar_type)
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-            logger=self.logger,
-        )
-
-        bar = Bar(
-            bar_type,
-            Price.from_str("1.00001"),
-            Price.from_str("1.00004"),
-            Price.from_str("1.00002"),
-            Price.from_str("1.00003"),
-            Quantity.from_int(100000),
-            0,
-            0,
-        )
+        self._register(strategy)
 
-        strategy.handle_bar(bar)
+        strategy.handle_bar(BAR_AUDUSD)
 
         # Act
         strategy.reset()
@@ -326,14 +310,7 @@ class TestStrategy:
         # Arrange
         bar_type = TestDataStubs.bartype_audusd_1min_bid()
         strategy = MockStrategy(bar_type)
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-            logger=self.logger,
-        )
+        self._register(strategy)
 
         strategy.reset()
 
@@ -348,14 +325,7 @@ class TestStrategy:
         # Arrange
         bar_type = TestDataStubs.bartype_audusd_1min_bid()
         strategy = MockStrategy(bar_type)
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-            logger=self.logger,
-        )
+        self._register(strategy)
 
         # Act
         state = strategy.save()
@@ -366,91 +336,31 @@ class TestStrategy:
         assert "on_save" in strategy.calls
         assert strategy.is_initialized
 
-    def test_register_indicator_for_quote_ticks_when_already_registered(self):
+    @pytest.mark.parametrize(
+        "register_method, source",
+        [
+            ["register_indicator_for_quote_ticks", AUDUSD_SIM.id],
+            ["register_indicator_for_trade_ticks", AUDUSD_SIM.id],
+            ["register_indicator_for_bars", TestDataStubs.bartype_audusd_1min_bid()],
+        ],
+    )
+    def test_register_indicator_when_already_registered(self, strategy, register_method, source):
         # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-            logger=self.logger,
-        )
-
-        ema1 = ExponentialMovingAverage(10, price_type=PriceType.MID)
-        ema2 = ExponentialMovingAverage(10, price_type=PriceType.MID)
-
-        # Act
-        strategy.register_indicator_for_quote_ticks(AUDUSD_SIM.id, ema1)
-        strategy.register_indicator_for_quote_ticks(AUDUSD_SIM.id, ema2)
-        strategy.register_indicator_for_quote_ticks(AUDUSD_SIM.id, ema2)
-
-        assert len(strategy.registered_indicators) == 2
-        assert ema1 in strategy.registered_indicators
-        assert ema2 in strategy.registered_indicators
-
-    def test_register_indicator_for_trade_ticks_when_already_registered(self):
-        # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-            logger=self.logger,
-        )
-
         ema1 = ExponentialMovingAverage(10)
         ema2 = ExponentialMovingAverage(10)
+        register = getattr(strategy, register_method)
 
         # Act
-        strategy.register_indicator_for_trade_ticks(AUDUSD_SIM.id, ema1)
-        strategy.register_indicator_for_trade_ticks(AUDUSD_SIM.id, ema2)
-        strategy.register_indicator_for_trade_ticks(AUDUSD_SIM.id, ema2)
+        register(source, ema1)
+        register(source, ema2)
+        register(source, ema2)
 
         assert len(strategy.registered_indicators) == 2
         assert ema1 in strategy.registered_indicators
         assert ema2 in strategy.registered_indicators
 
-    def test_register_indicator_for_bars_when_already_registered(self):
+    def test_register_indicator_for_multiple_data_sources(self, strategy):
         # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-            logger=self.logger,
-        )
-
-        ema1 = ExponentialMovingAverage(10)
-        ema2 = ExponentialMovingAverage(10)
-        bar_type = TestDataStubs.bartype_audusd_1min_bid()
-
-        # Act
-        strategy.register_indicator_for_bars(bar_type, ema1)
-        strategy.register_indicator_for_bars(bar_type, ema2)
-        strategy.register_indicator_for_bars(bar_type, ema2)
-
-        assert len(strategy.registered_indicators) == 2
-        assert ema1 in strategy.registered_indicators
-        assert ema2 in strategy.registered_indicators
-
-    def test_register_indicator_for_multiple_data_sources(self):
-        # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-            logger=self.logger,
-        )
-
         ema = ExponentialMovingAverage(10)
         bar_type = TestDataStubs.bartype_audusd_1min_bid()
 
@@ -463,201 +373,107 @@ class TestStrategy:
         assert len(strategy.registered_indicators) == 1
         assert ema in strategy.registered_indicators
 
-    def test_handle_quote_tick_updates_indicator_registered_for_quote_ticks(self):
+    @pytest.mark.parametrize(
+        "register_method, source, handler, datum",
+        [
+            [
+                "register_indicator_for_quote_ticks",
+                AUDUSD_SIM.id,
+                "handle_quote_tick",
+                QUOTE_TICK_AUDUSD,
+            ],
+            [
+                "register_indicator_for_trade_ticks",
+                AUDUSD_SIM.id,
+                "handle_trade_tick",
+                TRADE_TICK_AUDUSD,
+            ],
+            ["register_indicator_for_bars", BAR_AUDUSD.bar_type, "handle_bar", BAR_AUDUSD],
+        ],
+    )
+    def test_handle_data_updates_indicator_registered_for_data(
+        self,
+        strategy,
+        register_method,
+        source,
+        handler,
+        datum,
+    ):
         # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-            logger=self.logger,
-        )
-
         ema = ExponentialMovingAverage(10, price_type=PriceType.MID)
-        strategy.register_indicator_for_quote_ticks(AUDUSD_SIM.id, ema)
-
-        tick = TestDataStubs.quote_tick_5decimal(AUDUSD_SIM.id)
+        getattr(strategy, register_method)(source, ema)
 
         # Act
-        strategy.handle_quote_tick(tick)
-        strategy.handle_quote_tick(tick, True)
+        getattr(strategy, handler)(datum)
+        getattr(strategy, handler)(datum, True)
 
         # Assert
         assert ema.count == 2
 
-    def test_handle_quote_ticks_with_no_ticks_logs_and_continues(self):
-        # Arrange
-        strategy = KaboomStrategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-            logger=self.logger,
-        )
-
-        ema = ExponentialMovingAverage(10, price_type=PriceType.MID)
-        strategy.register_indicator_for_quote_ticks(AUDUSD_SIM.id, ema)
-
-        # Act
-        strategy.handle_quote_ticks([])
-
-        # Assert
-        assert ema.count == 0
-
-    def test_handle_quote_ticks_updates_indicator_registered_for_quote_ticks(self):
-        # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-            logger=self.logger,
-        )
-
-        ema = ExponentialMovingAverage(10, price_type=PriceType.MID)
-        strategy.register_indicator_for_quote_ticks(AUDUSD_SIM.id, ema)
-
-        tick = TestDataStubs.quote_tick_5decimal(AUDUSD_SIM.id)
-
-        # Act
-        strategy.handle_quote_ticks([tick])
-
-        # Assert
-        assert ema.count == 1
-
-    def test_handle_trade_tick_updates_indicator_registered_for_trade_ticks(self):
-        # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-            logger=self.logger,
-        )
-
-        ema = ExponentialMovingAverage(10)
-        strategy.register_indicator_for_trade_ticks(AUDUSD_SIM.id, ema)
-
-        tick = TestDataStubs.trade_tick_5decimal(AUDUSD_SIM.id)
-
-        # Act
-        strategy.handle_trade_tick(tick)
-        strategy.handle_trade_tick(tick, True)
-
-        # Assert
-        assert ema.count == 2
-
-    def test_handle_trade_ticks_updates_indicator_registered_for_trade_ticks(self):
-        # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-            logger=self.logger,
-        )
-
-        ema = ExponentialMovingAverage(10)
-        strategy.register_indicator_for_trade_ticks(AUDUSD_SIM.id, ema)
-
-        tick = TestDataStubs.trade_tick_5decimal(AUDUSD_SIM.id)
-
-        # Act
-        strategy.handle_trade_ticks([tick])
-
-        # Assert
-        assert ema.count == 1
-
-    def test_handle_trade_ticks_with_no_ticks_logs_and_continues(self):
-        # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-            logger=self.logger,
-        )
-
-        ema = ExponentialMovingAverage(10)
-        strategy.register_indicator_for_trade_ticks(AUDUSD_SIM.id, ema)
-
-        # Act
-        strategy.handle_trade_ticks([])
-
-        # Assert
-        assert ema.count == 0
-
-    def test_handle_bar_updates_indicator_registered_for_bars(self):
-        # Arrange
-        bar_type = TestDataStubs.bartype_audusd_1min_bid()
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-            logger=self.logger,
-        )
-
-        ema = ExponentialMovingAverage(10)
-        strategy.register_indicator_for_bars(bar_type, ema)
-        bar = TestDataStubs.bar_5decimal()
+    @pytest.mark.parametrize(
+        "register_method, source, handler, datum",
+        [
+            [
+                "register_indicator_for_quote_ticks",
+                AUDUSD_SIM.id,
+                "handle_quote_ticks",
+                QUOTE_TICK_AUDUSD,
+            ],
+            [
+                "register_indicator_for_trade_ticks",
+                AUDUSD_SIM.id,
+                "handle_trade_ticks",
+                TRADE_TICK_AUDUSD,
+            ],
+            ["register_indicator_for_bars", BAR_AUDUSD.bar_type, "handle_bars", BAR_AUDUSD],
+        ],
+    )
+    def test_handle_historical_data_updates_indicator_registered_for_data(
+        self,
+        strategy,
+        register_method,
+        source,
+        handler,
+        datum,
+    ):
+        # Arrange
+        ema = ExponentialMovingAverage(10, price_type=PriceType.MID)
+        getattr(strategy, register_method)(source, ema)
 
         # Act
-        strategy.handle_bar(bar)
-        strategy.handle_bar(bar, True)
+        getattr(strategy, handler)([datum])
 
         # Assert
-        assert ema.count == 2
+        assert ema.count == 1
 
-    def test_handle_bars_updates_indicator_registered_for_bars(self):
+    def test_handle_quote_ticks_with_no_ticks_logs_and_continues(self):
         # Arrange
-        bar_type = TestDataStubs.bartype_audusd_1min_bid()
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-            logger=self.logger,
-        )
+        strategy = KaboomStrategy()
+        self._register(strategy)
 
+        ema = ExponentialMovingAverage(10, price_type=PriceType.MID)
+        strategy.register_indicator_for_quote_ticks(AUDUSD_SIM.id, ema)
+
+        # Act
+        strategy.handle_quote_ticks([])
+
+        # Assert
+        assert ema.count == 0
+
+    def test_handle_trade_ticks_with_no_ticks_logs_and_continues(self, strategy):
+        # Arrange
         ema = ExponentialMovingAverage(10)
-        strategy.register_indicator_for_bars(bar_type, ema)
-        bar = TestDataStubs.bar_5decimal()
+        strategy.register_indicator_for_trade_ticks(AUDUSD_SIM.id, ema)
 
         # Act
-        strategy.handle_bars([bar])
+        strategy.handle_trade_ticks([])
 
         # Assert
-        assert ema.count == 1
+        assert ema.count == 0
 
-    def test_handle_bars_with_no_bars_logs_and_continues(self):
+    def test_handle_bars_with_no_bars_logs_and_continues(self, strategy):
         # Arrange
         bar_type = TestDataStubs.bartype_gbpusd_1sec_mid()
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-            logger=self.logger,
-        )
 
         ema = ExponentialMovingAverage(10)
         strategy.register_indicator_for_bars(bar_type, ema)
@@ -672,16 +488,9 @@ class TestStrategy:
         # Arrange
         bar_type = TestDataStubs.bartype_audusd_1min_bid()
         strategy = MockStrategy(bar_type)
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-            logger=self.logger,
-        )
+        self._register(strategy)
 
-        alert_time = datetime.now(pytz.utc) + timedelta(milliseconds=200)
+        alert_time = strategy.clock.utc_now() + timedelta(milliseconds=200)
         strategy.clock.set_time_alert("test_alert1", alert_time)
 
         # Act
@@ -695,16 +504,9 @@ class TestStrategy:
         # Arrange
         bar_type = TestDataStubs.bartype_audusd_1min_bid()
         strategy = MockStrategy(bar_type)
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-            logger=self.logger,
-        )
+        self._register(strategy)
 
-        start_time = datetime.now(pytz.utc) + timedelta(milliseconds=100)
+        start_time = strategy.clock.utc_now() + timedelta(milliseconds=100)
         strategy.clock.set_timer(
             "test_timer", timedelta(milliseconds=100), start_time, stop_time=None
         )
@@ -716,22 +518,12 @@ class TestStrategy:
         # Assert
         assert len(strategy.clock.timer_names()) == 0
 
-    def test_submit_order_with_valid_order_successfully_submits(self):
+    def test_submit_order_with_valid_order_successfully_submits(self, strategy):
         # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-            logger=self.logger,
-        )
-
         order = strategy.order_factory.market(
             USDJPY_SIM.id,
             OrderSide.BUY,
-            Quantity.from_int(100000),
+            QTY_100000,
         )
 
         # Act
@@ -745,24 +537,14 @@ class TestStrategy:
         assert not strategy.cache.is_order_open(order.client_order_id)
         assert strategy.cache.is_order_closed(order.client_order_id)
 
-    def test_submit_order_list_with_valid_order_successfully_submits(self):
+    def test_submit_order_list_with_valid_order_successfully_submits(self, strategy):
         # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-            logger=self.logger,
-        )
-
         bracket = strategy.order_factory.bracket_market(
             USDJPY_SIM.id,
             OrderSide.BUY,
-            Quantity.from_int(100000),
-            stop_loss=Price.from_str("90.000"),
-            take_profit=Price.from_str("90.500"),
+            QTY_100000,
+            stop_loss=PRICE_90_000,
+            take_profit=PRICE_90_500,
         )
 
         # Act
@@ -778,23 +560,13 @@ class TestStrategy:
         # assert strategy.cache.is_order_open(entry.client_order_id)
         # assert not strategy.cache.is_order_closed(entry.client_order_id)
 
-    def test_cancel_order(self):
+    def test_cancel_order(self, strategy):
         # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-            logger=self.logger,
-        )
-
         order = strategy.order_factory.stop_market(
             USDJPY_SIM.id,
             OrderSide.BUY,
-            Quantity.from_int(100000),
-            Price.from_str("90.006"),
+            QTY_100000,
+            PRICE_90_006,
         )
 
         strategy.submit_order(order)
@@ -813,23 +585,13 @@ class TestStrategy:
         assert not strategy.cache.is_order_open(order.client_order_id)
         assert strategy.cache.is_order_closed(order.client_order_id)
 
-    def test_cancel_order_when_pending_cancel_does_not_submit_command(self):
+    def test_cancel_order_when_pending_cancel_does_not_submit_command(self, strategy):
         # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-            logger=self.logger,
-        )
-
         order = strategy.order_factory.stop_market(
             USDJPY_SIM.id,
             OrderSide.BUY,
-            Quantity.from_int(100000),
-            Price.from_str("90.006"),
+            QTY_100000,
+            PRICE_90_006,
         )
 
         strategy.submit_order(order)
@@ -847,23 +609,13 @@ class TestStrategy:
         assert strategy.cache.is_order_open(order.client_order_id)
         assert not strategy.cache.is_order_closed(order.client_order_id)
 
-    def test_cancel_order_when_closed_does_not_submit_command(self):
+    def test_cancel_order_when_closed_does_not_submit_command(self, strategy):
         # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-            logger=self.logger,
-        )
-
         order = strategy.order_factory.stop_market(
             USDJPY_SIM.id,
             OrderSide.BUY,
-            Quantity.from_int(100000),
-            Price.from_str("90.006"),
+            QTY_100000,
+            PRICE_90_006,
         )
 
         strategy.submit_order(order)
@@ -881,156 +633,73 @@ class TestStrategy:
         assert not strategy.cache.is_order_open(order.client_order_id)
         assert strategy.cache.is_order_closed(order.client_order_id)
 
-    def test_modify_order_when_pending_update_does_not_submit_command(self):
+    @pytest.mark.parametrize(
+        "make_event",
+        [
+            TestEventStubs.order_pending_update,
+            TestEventStubs.order_pending_cancel,
+            TestEventStubs.order_expired,
+        ],
+    )
+    def test_modify_order_when_pending_or_closed_does_not_submit_command(
+        self,
+        strategy,
+        make_event,
+    ):
         # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-            logger=self.logger,
-        )
-
         order = strategy.order_factory.limit(
             USDJPY_SIM.id,
             OrderSide.BUY,
-            Quantity.from_int(100000),
-            Price.from_str("90.001"),
+            QTY_100000,
+            PRICE_90_001,
         )
 
         strategy.submit_order(order)
         self.exchange.process(0)
-        self.exec_engine.process(TestEventStubs.order_pending_update(order))
-
-        # Act
-        strategy.modify_order(
-            order=order,
-            quantity=Quantity.from_int(100000),
-            price=Price.from_str("90.000"),
-        )
-        self.exchange.process(0)
-
-        # Assert
-        assert self.exec_engine.command_count == 1
-
-    def test_modify_order_when_pending_cancel_does_not_submit_command(self):
-        # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-            logger=self.logger,
-        )
-
-        order = strategy.order_factory.limit(
-            USDJPY_SIM.id,
-            OrderSide.BUY,
-            Quantity.from_int(100000),
-            Price.from_str("90.001"),
-        )
+        self.exec_engine.process(make_event(order))
 
-        strategy.submit_order(order)
-        self.exchange.process(0)
-        self.exec_engine.process(TestEventStubs.order_pending_cancel(order))
+        command_count = self.exec_engine.command_count
 
         # Act
         strategy.modify_order(
             order=order,
-            quantity=Quantity.from_int(100000),
-            price=Price.from_str("90.000"),
+            quantity=QTY_100000,
+            price=PRICE_90_000,
         )
-        self.exchange.process(0)
 
         # Assert
-        assert self.exec_engine.command_count == 1
+        assert self.exec_engine.command_count == command_count
 
-    def test_modify_order_when_closed_does_not_submit_command(self):
+    def test_modify_order_when_no_changes_does_not_submit_command(self, strategy):
         # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-            logger=self.logger,
-        )
-
         order = strategy.order_factory.limit(
             USDJPY_SIM.id,
             OrderSide.BUY,
-            Quantity.from_int(100000),
-            Price.from_str("90.001"),
+            QTY_100000,
+            PRICE_90_001,
         )
 
         strategy.submit_order(order)
-        self.exchange.process(0)
-        self.exec_engine.process(TestEventStubs.order_expired(order))
-
-        # Act
-        strategy.modify_order(
-            order=order,
-            quantity=Quantity.from_int(100000),
-            price=Price.from_str("90.000"),
-        )
-        self.exchange.process(0)
-
-        # Assert
-        assert self.exec_engine.command_count == 1
-
-    def test_modify_order_when_no_changes_does_not_submit_command(self):
-        # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-            logger=self.logger,
-        )
-
-        order = strategy.order_factory.limit(
-            USDJPY_SIM.id,
-            OrderSide.BUY,
-            Quantity.from_int(100000),
-            Price.from_str("90.001"),
-        )
 
-        strategy.submit_order(order)
+        command_count = self.exec_engine.command_count
 
         # Act
         strategy.modify_order(
             order=order,
-            quantity=Quantity.from_int(100000),
-            price=Price.from_str("90.001"),
+            quantity=QTY_100000,
+            price=PRICE_90_001,
         )
 
         # Assert
-        assert self.exec_engine.command_count == 1
+        assert self.exec_engine.command_count == command_count
 
-    def test_modify_order(self):
+    def test_modify_order(self, strategy):
         # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-            logger=self.logger,
-        )
-
         order = strategy.order_factory.limit(
             USDJPY_SIM.id,
             OrderSide.BUY,
-            Quantity.from_int(100000),
-            Price.from_str("90.000"),
+            QTY_100000,
+            PRICE_90_000,
         )
 
         strategy.submit_order(order)
@@ -1039,49 +708,39 @@ class TestStrategy:
         # Act
         strategy.modify_order(
             order=order,
-            quantity=Quantity.from_int(110000),
-            price=Price.from_str("90.001"),
+            quantity=QTY_110000,
+            price=PRICE_90_001,
         )
         self.exchange.process(0)
 
         # Assert
-        assert strategy.cache.orders()[0] == order
-        assert strategy.cache.orders()[0].status == OrderStatus.ACCEPTED
-        assert strategy.cache.orders()[0].quantity == Quantity.from_int(110000)
-        assert strategy.cache.orders()[0].price == Price.from_str("90.001")
+        cached_order = strategy.cache.orders()[0]
+        assert cached_order == order
+        assert cached_order.status == OrderStatus.ACCEPTED
+        assert cached_order.quantity == QTY_110000
+        assert cached_order.price == PRICE_90_001
         assert strategy.cache.order_exists(order.client_order_id)
         assert strategy.cache.is_order_open(order.client_order_id)
         assert not strategy.cache.is_order_closed(order.client_order_id)
         assert strategy.portfolio.is_flat(order.instrument_id)
 
-    def test_cancel_all_orders(self):
+    def test_cancel_all_orders(self, strategy):
         # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-            logger=self.logger,
-        )
-
         order1 = strategy.order_factory.stop_market(
             USDJPY_SIM.id,
             OrderSide.BUY,
-            Quantity.from_int(100000),
-            Price.from_str("90.007"),
+            QTY_100000,
+            PRICE_90_007,
         )
 
         order2 = strategy.order_factory.stop_market(
             USDJPY_SIM.id,
             OrderSide.BUY,
-            Quantity.from_int(100000),
-            Price.from_str("90.006"),
+            QTY_100000,
+            PRICE_90_006,
         )
 
         strategy.submit_order(order1)
-        self.exchange.process(0)
         strategy.submit_order(order2)
         self.exchange.process(0)
 
@@ -1090,73 +749,40 @@ class TestStrategy:
         self.exchange.process(0)
 
         # Assert
-        assert order1 in self.cache.orders()
-        assert order2 in self.cache.orders()
-        assert self.cache.orders()[0].status == OrderStatus.CANCELED
-        assert self.cache.orders()[1].status == OrderStatus.CANCELED
-        assert order1 in self.cache.orders_closed()
-        assert order2 in strategy.cache.orders_closed()
-
-    def test_close_position_when_position_already_closed_does_nothing(self):
-        # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-            logger=self.logger,
-        )
-
-        order1 = strategy.order_factory.market(
-            USDJPY_SIM.id,
-            OrderSide.BUY,
-            Quantity.from_int(100000),
-        )
-
-        order2 = strategy.order_factory.market(
-            USDJPY_SIM.id,
-            OrderSide.SELL,
-            Quantity.from_int(100000),
-        )
-
-        strategy.submit_order(order1)
-        self.exchange.process(0)
-        strategy.submit_order(order2, PositionId("SIM-1-001"))  # Generated by exchange
-        self.exchange.process(0)
-
-        position = strategy.cache.positions_closed()[0]
-
-        # Act
-        strategy.close_position(position)
-        self.exchange.process(0)
-
-        # Assert
-        assert strategy.portfolio.is_completely_flat()
+        assert order1.status == OrderStatus.CANCELED
+        assert order2.status == OrderStatus.CANCELED
+        assert self.cache.is_order_closed(order1.client_order_id)
+        assert self.cache.is_order_closed(order2.client_order_id)
 
-    def test_close_position(self):
+    @pytest.mark.parametrize(
+        "already_closed, expected_exit_tags",
+        [
+            [False, "EXIT"],
+            [True, None],  # Close does nothing, the only sell is the manual one
+        ],
+    )
+    def test_close_position(self, strategy, already_closed, expected_exit_tags):
         # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-            logger=self.logger,
-        )
-
         order = strategy.order_factory.market(
             USDJPY_SIM.id,
             OrderSide.BUY,
-            Quantity.from_int(100000),
+            QTY_100000,
         )
 
         strategy.submit_order(order)
         self.exchange.process(0)
 
-        position = self.cache.positions_open()[0]
+        if already_closed:
+            sell = strategy.order_factory.market(
+                USDJPY_SIM.id,
+                OrderSide.SELL,
+                QTY_100000,
+            )
+            strategy.submit_order(sell, PositionId("SIM-1-001"))  # Generated by exchange
+            self.exchange.process(0)
+            position = self.cache.positions_closed()[0]
+        else:
+            position = self.cache.positions_open()[0]
 
         # Act
         strategy.close_position(position, tags="EXIT")
@@ -1166,39 +792,28 @@ class TestStrategy:
         assert order.status == OrderStatus.FILLED
         assert strategy.portfolio.is_completely_flat()
         orders = self.cache.orders(instrument_id=USDJPY_SIM.id)
-        for order in orders:
-            if order.side == OrderSide.SELL:
-                assert order.tags == "EXIT"
+        sells = [o for o in orders if o.side == OrderSide.SELL]
+        assert len(sells) == 1
+        assert sells[0].tags == expected_exit_tags
 
-    def test_close_all_positions(self):
+    def test_close_all_positions(self, strategy):
         # Arrange
-        strategy = Strategy()
-        strategy.register(
-            trader_id=self.trader_id,
-            portfolio=self.portfolio,
-            msgbus=self.msgbus,
-            cache=self.cache,
-            clock=self.clock,
-            logger=self.logger,
-        )
-
         # Start strategy and submit orders to open positions
         strategy.start()
 
         order1 = strategy.order_factory.market(
             USDJPY_SIM.id,
             OrderSide.BUY,
-            Quantity.from_int(100000),
+            QTY_100000,
         )
 
         order2 = strategy.order_factory.market(
             USDJPY_SIM.id,
             OrderSide.BUY,
-            Quantity.from_int(100000),
+            QTY_100000,
         )
 
         strategy.submit_order(order1)
-        self.exchange.process(0)
         strategy.submit_order(order2)
         self.exchange.process(0)
 